@@ -6,27 +6,65 @@ functionality of FlightOptima for web applications.
 """
 
 from flask import Flask, jsonify, request, send_from_directory
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
 from datetime import datetime, timedelta
+from collections import OrderedDict
+from itertools import islice
+from operator import attrgetter
+from typing import Optional
+import gzip
+import hashlib
 import os
 import sys
 import random
+import threading
 
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import orjson
+
+try:
+    # C parser for the ISO 8601 timestamps in request bodies; optional
+    from ciso8601 import parse_datetime as parse_iso_datetime
+except ImportError:
+    parse_iso_datetime = datetime.fromisoformat
+
+# Add parent directory to path (already there when run as api.app from the repo root)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
 from src.models.airport import Airport
 from src.models.flight import Flight
 from src.models.pilot import Pilot, PilotAssignment
-from src.models.graph import RouteGraph, ConflictGraph
 from src.algorithms.routing import RoutePlanner, RouteResult
 from src.algorithms.scheduling import RunwayScheduler, ScheduleResult
 from src.algorithms.pilot_scheduling import PilotScheduler, PilotScheduleResult
 from src.utils.data_loader import DataLoader
 
 
+class ORJSONProvider(JSONProvider):
+    """
+    JSON provider backed by orjson.
+    
+    orjson encodes datetimes as ISO 8601 strings and dataclasses as
+    objects natively, so Flight instances and raw datetime values can be
+    placed in response dicts without converting them first.
+    """
+    
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj), mimetype='application/json')
+
+
 # Initialize Flask app
 app = Flask(__name__, static_folder='../frontend/build', static_url_path='')
+app.json = ORJSONProvider(app)
 CORS(app)  # Enable CORS for React development
 
 # Global instances
@@ -34,6 +72,30 @@ data_loader = DataLoader()
 route_graph = None
 route_planner = None
 
+# Serialized airports keyed by airport ID (airports never change after load)
+_airport_dict_cache = {}
+
+# Pre-encoded (body, gzipped body, etag) for endpoints that only read the route graph
+_static_payloads = {}
+
+# JSON responses smaller than this (in bytes) are sent uncompressed
+COMPRESS_MIN_SIZE = 500
+
+# Most flights accepted in one /api/schedule request
+MAX_SCHEDULE_FLIGHTS = 500
+
+# Encoded /api/schedule bodies keyed by a digest of the request, most
+# recently used last; bodies larger than the byte cap are not kept
+SCHEDULE_CACHE_SIZE = 256
+SCHEDULE_CACHE_MAX_BODY = 64 * 1024
+_schedule_body_cache = OrderedDict()
+_schedule_body_lock = threading.Lock()
+
+# Origin pools used when simulating traffic for each endpoint
+ROUTE_TRAFFIC_ORIGINS = ('JFK', 'CDG', 'FRA', 'DXB', 'SIN', 'ORD', 'LAX', 'MAD', 'FCO', 'IST', 'AMS')
+GENERATED_FLIGHT_ORIGINS = ROUTE_TRAFFIC_ORIGINS + ('BOS', 'SFO')
+DEMO_FLIGHT_ORIGINS = ROUTE_TRAFFIC_ORIGINS[:-1]
+
 
 def init_data():
     """Initialize data on startup."""
@@ -41,6 +103,17 @@ def init_data():
     try:
         route_graph = data_loader.load_route_graph(bidirectional=True, calculate_distance=False)
         route_planner = RoutePlanner(route_graph)
+        
+        _airport_dict_cache.clear()
+        for airport in route_graph.get_all_airports():
+            airport_to_dict(airport)
+        
+        # The route graph is immutable from here on, so encode once
+        for name, payload in (('airports', build_airports_payload()),
+                              ('routes', build_routes_payload())):
+            body = orjson.dumps(payload)
+            _static_payloads[name] = (body, gzip.compress(body, 9),
+                                      hashlib.sha1(body).hexdigest())
         return True
     except Exception as e:
         print(f"Error loading data: {e}")
@@ -48,28 +121,23 @@ def init_data():
 
 
 def airport_to_dict(airport: Airport) -> dict:
-    """Convert Airport to JSON-serializable dict."""
-    return {
-        'id': airport.id,
-        'name': airport.name,
-        'latitude': airport.latitude,
-        'longitude': airport.longitude,
-        'weather_factor': airport.weather_factor
-    }
-
-
-def flight_to_dict(flight: Flight) -> dict:
-    """Convert Flight to JSON-serializable dict."""
-    return {
-        'flight_id': flight.flight_id,
-        'origin': flight.origin,
-        'destination': flight.destination,
-        'arrival_start': flight.arrival_start.isoformat(),
-        'arrival_end': flight.arrival_end.isoformat(),
-        'occupancy_time': flight.occupancy_time,
-        'runway_id': flight.runway_id,
-        'priority': flight.priority
-    }
+    """
+    Convert Airport to JSON-serializable dict.
+    
+    The dict is memoized by airport ID, so airports repeated across a
+    route's path and segments are only converted once.
+    """
+    cached = _airport_dict_cache.get(airport.id)
+    if cached is None:
+        cached = {
+            'id': airport.id,
+            'name': airport.name,
+            'latitude': airport.latitude,
+            'longitude': airport.longitude,
+            'weather_factor': airport.weather_factor
+        }
+        _airport_dict_cache[airport.id] = cached
+    return cached
 
 
 def route_result_to_dict(result: RouteResult) -> dict:
@@ -79,7 +147,7 @@ def route_result_to_dict(result: RouteResult) -> dict:
         'destination': airport_to_dict(result.destination),
         'path': [airport_to_dict(a) for a in result.path],
         'total_distance': round(result.total_distance, 2),
-        'eta': result.eta.isoformat(),
+        'eta': result.eta,
         'flight_time_minutes': int(result.flight_time.total_seconds() / 60),
         'segments': [
             {
@@ -93,13 +161,21 @@ def route_result_to_dict(result: RouteResult) -> dict:
 
 
 def schedule_result_to_dict(result: ScheduleResult) -> dict:
-    """Convert ScheduleResult to JSON-serializable dict."""
-    runway_assignments = {}
-    for runway_id, flights in result.runway_assignments.items():
-        runway_assignments[str(runway_id)] = [flight_to_dict(f) for f in sorted(flights, key=lambda x: x.arrival_start)]
+    """
+    Convert ScheduleResult to JSON-serializable dict.
+    
+    Flight objects are left as-is; the orjson provider serializes the
+    dataclass fields directly, skipping an intermediate dict per flight.
+    The combined flight list comes from ScheduleResult.iter_flights_by_arrival,
+    which merges the already-sorted runway lists.
+    """
+    runway_assignments = {
+        str(runway_id): flights
+        for runway_id, flights in result.runway_assignments.items()
+    }
     
     return {
-        'flights': [flight_to_dict(f) for f in sorted(result.flights, key=lambda x: x.arrival_start)],
+        'flights': list(result.iter_flights_by_arrival()),
         'num_runways': result.num_runways,
         'runway_assignments': runway_assignments,
         'conflicts_resolved': result.conflicts_resolved
@@ -118,7 +194,7 @@ def pilot_to_dict(pilot: Pilot) -> dict:
         'total_hours_today': round(pilot.total_hours_today, 2),
         'remaining_hours': round(pilot.get_remaining_hours(), 2),
         'home_base': pilot.home_base,
-        'availability_time': pilot.get_availability_time().isoformat() if pilot.get_availability_time() else None
+        'availability_time': pilot.get_availability_time()
     }
 
 
@@ -127,22 +203,322 @@ def pilot_assignment_to_dict(assignment: PilotAssignment) -> dict:
     return {
         'pilot_id': assignment.pilot_id,
         'flight_id': assignment.flight_id,
-        'assignment_time': assignment.assignment_time.isoformat(),
-        'flight_start': assignment.flight_start.isoformat(),
-        'flight_end': assignment.flight_end.isoformat(),
-        'duration_hours': round((assignment.flight_end - assignment.flight_start).total_seconds() / 3600, 2)
+        'assignment_time': assignment.assignment_time,
+        'flight_start': assignment.flight_start,
+        'flight_end': assignment.flight_end,
+        'duration_hours': round(assignment.duration_hours, 2)
     }
 
 
 def pilot_schedule_result_to_dict(result: PilotScheduleResult, pilots: list) -> dict:
     """Convert PilotScheduleResult to JSON-serializable dict."""
     return {
-        'assignments': [pilot_assignment_to_dict(a) for a in sorted(result.assignments, key=lambda x: x.flight_start)],
-        'unassigned_flights': [flight_to_dict(f) for f in result.unassigned_flights],
+        'assignments': list(map(pilot_assignment_to_dict,
+                                sorted(result.assignments, key=attrgetter('flight_start')))),
+        'unassigned_flights': result.unassigned_flights,
         'pilot_utilization': result.pilot_utilization,
         'total_pilots_used': result.total_pilots_used,
         'compliance_rate': round(result.compliance_rate, 1),
-        'pilots': [pilot_to_dict(p) for p in pilots]
+        'pilots': list(map(pilot_to_dict, pilots))
+    }
+
+
+def build_airports_payload() -> dict:
+    """Build the /api/airports response body from the route graph."""
+    airports = route_graph.get_all_airports()
+    return {
+        'airports': [airport_to_dict(a) for a in sorted(airports, key=lambda x: x.id)],
+        'count': len(airports)
+    }
+
+
+def build_routes_payload() -> dict:
+    """Build the /api/routes response body from the route graph."""
+    edges = route_graph.get_all_edges()
+    routes = []
+    
+    for source_id, dest_id, distance in edges:
+        source = route_graph.get_node(source_id)
+        dest = route_graph.get_node(dest_id)
+        if source and dest:
+            routes.append({
+                'source': airport_to_dict(source),
+                'destination': airport_to_dict(dest),
+                'distance': round(distance, 2)
+            })
+    
+    return {
+        'routes': routes,
+        'count': len(routes)
+    }
+
+
+def static_json_response(name: str):
+    """
+    Return a payload pre-encoded by init_data().
+    
+    The ETag lets browsers and caches revalidate with a 304 instead of
+    downloading the unchanged body again. Clients that accept gzip get
+    the copy compressed at startup.
+    """
+    body, gzipped, etag = _static_payloads[name]
+    
+    if accepts_gzip():
+        response = app.response_class(gzipped, mimetype='application/json')
+        response.headers['Content-Encoding'] = 'gzip'
+        etag += '-gzip'
+    else:
+        response = app.response_class(body, mimetype='application/json')
+    
+    response.vary.add('Accept-Encoding')
+    response.set_etag(etag)
+    return response.make_conditional(request)
+
+
+def accepts_gzip() -> bool:
+    """Check whether the client accepts gzip-encoded responses."""
+    return request.accept_encodings['gzip'] > 0
+
+
+def simulate_arrivals(destination: str, around: datetime, count: int,
+                      window_minutes: int, origins: tuple,
+                      occupancy_range: tuple = (10, 20),
+                      priority_range: tuple = (1, 10),
+                      exclude: tuple = ()) -> list:
+    """
+    Generate random flights arriving at a destination around a given time.
+    
+    Each random attribute is drawn for all flights in a single
+    random.choices() call rather than per flight.
+    
+    Args:
+        destination: Destination airport code
+        around: Time around which arrivals are spread
+        count: Number of flights to generate
+        window_minutes: Maximum offset (in minutes) from `around`
+        origins: Candidate origin airport codes
+        occupancy_range: Inclusive (min, max) runway occupancy in minutes
+        priority_range: Inclusive (min, max) flight priority
+        exclude: Additional airport codes not to use as origins
+        
+    Returns:
+        List of Flight objects with IDs FL001, FL002, ...
+    """
+    candidates = tuple(o for o in origins if o != destination and o not in exclude)
+    
+    offsets = random.choices(range(-window_minutes, window_minutes + 1), k=count)
+    occupancies = random.choices(range(occupancy_range[0], occupancy_range[1] + 1), k=count)
+    priorities = random.choices(range(priority_range[0], priority_range[1] + 1), k=count)
+    chosen_origins = random.choices(candidates, k=count)
+    
+    return [
+        Flight(
+            flight_id=f"FL{i+1:03d}",
+            origin=chosen_origins[i],
+            destination=destination,
+            arrival_start=around + timedelta(minutes=offsets[i]),
+            occupancy_time=occupancies[i],
+            priority=priorities[i]
+        )
+        for i in range(count)
+    ]
+
+
+def parse_flights(rows: list) -> list:
+    """
+    Build Flight objects from the 'flights' array of a request body.
+    
+    Args:
+        rows: Flight dicts with at least flight_id and arrival_start
+        
+    Returns:
+        List of Flight objects
+        
+    Raises:
+        KeyError: If a required field is missing
+        ValueError: If a timestamp or field value is invalid
+    """
+    parse = parse_iso_datetime
+    return [
+        Flight(
+            flight_id=row['flight_id'],
+            origin=row.get('origin', 'UNK'),
+            destination=row.get('destination', 'UNK'),
+            arrival_start=parse(row['arrival_start']),
+            occupancy_time=row.get('occupancy_time', 15),
+            priority=row.get('priority', 5)
+        )
+        for row in rows
+    ]
+
+
+def schedule_response_body(flights: list, algorithm: str) -> bytes:
+    """
+    Schedule flights and return the encoded /api/schedule response.
+    
+    Scheduling is deterministic for a given flight list and algorithm,
+    so identical requests reuse the encoded body instead of recoloring.
+    The cache is keyed by a digest of the normalized flight rows, holds at
+    most SCHEDULE_CACHE_SIZE bodies, and skips bodies over
+    SCHEDULE_CACHE_MAX_BODY bytes.
+    
+    Args:
+        flights: Flight objects parsed from the request
+        algorithm: Coloring algorithm name
+        
+    Returns:
+        JSON response body as bytes
+    """
+    rows = [
+        (f.flight_id, f.origin, f.destination, f.arrival_start, f.occupancy_time, f.priority)
+        for f in flights
+    ]
+    key = hashlib.sha256(orjson.dumps([algorithm, rows])).digest()
+    
+    with _schedule_body_lock:
+        body = _schedule_body_cache.get(key)
+        if body is not None:
+            _schedule_body_cache.move_to_end(key)
+            return body
+    
+    body = build_schedule_response_body(flights, algorithm)
+    
+    if len(body) <= SCHEDULE_CACHE_MAX_BODY:
+        with _schedule_body_lock:
+            _schedule_body_cache[key] = body
+            if len(_schedule_body_cache) > SCHEDULE_CACHE_SIZE:
+                _schedule_body_cache.popitem(last=False)
+    
+    return body
+
+
+def build_schedule_response_body(flights: list, algorithm: str) -> bytes:
+    """
+    Schedule flights and encode the /api/schedule response.
+    
+    Args:
+        flights: Flight objects to schedule
+        algorithm: Coloring algorithm name
+        
+    Returns:
+        JSON response body as bytes
+    """
+    scheduler = RunwayScheduler(algorithm=algorithm)
+    result = scheduler.schedule(flights)
+    is_valid, validation_errors = scheduler.validate_schedule(result.flights)
+    
+    response = schedule_result_to_dict(result)
+    response['algorithm'] = algorithm
+    response['is_valid'] = is_valid
+    response['validation_errors'] = validation_errors
+    response['conflicts'] = conflicts_to_dicts(result)
+    
+    return orjson.dumps(response)
+
+
+def wants_ndjson() -> bool:
+    """Check whether the client asked for a streamed NDJSON response."""
+    best = request.accept_mimetypes.best_match(['application/json', 'application/x-ndjson'])
+    return best == 'application/x-ndjson'
+
+
+def stream_schedule(result: ScheduleResult, meta: dict):
+    """
+    Stream a schedule as newline-delimited JSON.
+    
+    Emits a 'meta' line with the summary fields, one 'runway' line per
+    runway, then a 'conflicts' line, so clients can start rendering
+    before the whole schedule has been encoded.
+    
+    Args:
+        result: ScheduleResult to stream
+        meta: Extra summary fields for the 'meta' line
+    """
+    def generate():
+        yield orjson.dumps({
+            'type': 'meta',
+            'num_runways': result.num_runways,
+            'num_flights': len(result.flights),
+            'conflicts_resolved': result.conflicts_resolved,
+            **meta
+        }) + b'\n'
+        
+        for runway_id in sorted(result.runway_assignments):
+            yield orjson.dumps({
+                'type': 'runway',
+                'runway_id': runway_id,
+                'flights': result.runway_assignments[runway_id]
+            }) + b'\n'
+        
+        yield orjson.dumps({'type': 'conflicts', 'conflicts': conflicts_to_dicts(result)}) + b'\n'
+    
+    return app.response_class(generate(), mimetype='application/x-ndjson')
+
+
+def conflicts_to_dicts(result: ScheduleResult) -> list:
+    """
+    Convert the scheduler's conflict edges to {'flight1', 'flight2'} dicts.
+    
+    The edges come from the conflict graph RunwayScheduler already built,
+    so the endpoints don't detect conflicts a second time.
+    """
+    return [
+        {'flight1': min(a, b), 'flight2': max(a, b)}
+        for a, b in result.conflict_edges
+    ]
+
+
+def plan_route_with_scheduling(source_id: str, dest_id: str, num_flights: int,
+                               departure_time: datetime) -> Optional[dict]:
+    """
+    Find a route and simulate runway scheduling at its destination.
+    
+    Args:
+        source_id: Source airport ID
+        dest_id: Destination airport ID
+        num_flights: Number of other flights arriving around our ETA
+        departure_time: Departure time of our flight
+        
+    Returns:
+        Response dict, or None if no route exists
+    """
+    route_result = route_planner.find_shortest_path(source_id, dest_id, departure_time)
+    
+    if not route_result:
+        return None
+    
+    # Generate flights arriving around our ETA
+    our_eta = route_result.eta
+    flights = [
+        Flight(
+            flight_id="YOUR_FLIGHT",
+            origin=source_id,
+            destination=dest_id,
+            arrival_start=our_eta,
+            occupancy_time=15,
+            priority=1
+        )
+    ]
+    
+    flights.extend(simulate_arrivals(dest_id, our_eta, num_flights, 30, ROUTE_TRAFFIC_ORIGINS,
+                                     occupancy_range=(10, 18), priority_range=(2, 8),
+                                     exclude=(source_id,)))
+    
+    # Schedule
+    scheduler = RunwayScheduler(algorithm='dsatur')
+    schedule_result = scheduler.schedule(flights)
+    
+    # Validate schedule
+    is_valid, _ = scheduler.validate_schedule(schedule_result.flights)
+    
+    schedule_response = schedule_result_to_dict(schedule_result)
+    schedule_response['is_valid'] = is_valid
+    schedule_response['conflicts'] = conflicts_to_dicts(schedule_result)
+    
+    return {
+        'route': route_result_to_dict(route_result),
+        'schedule': schedule_response,
+        'your_flight': next(f for f in schedule_result.flights if f.flight_id == "YOUR_FLIGHT")
     }
 
 
@@ -170,11 +546,7 @@ def get_airports():
     if not route_graph:
         return jsonify({'error': 'Data not loaded'}), 500
     
-    airports = route_graph.get_all_airports()
-    return jsonify({
-        'airports': [airport_to_dict(a) for a in sorted(airports, key=lambda x: x.id)],
-        'count': len(airports)
-    })
+    return static_json_response('airports')
 
 
 @app.route('/api/airports/<airport_id>')
@@ -196,23 +568,7 @@ def get_routes():
     if not route_graph:
         return jsonify({'error': 'Data not loaded'}), 500
     
-    edges = route_graph.get_all_edges()
-    routes = []
-    
-    for source_id, dest_id, distance in edges:
-        source = route_graph.get_node(source_id)
-        dest = route_graph.get_node(dest_id)
-        if source and dest:
-            routes.append({
-                'source': airport_to_dict(source),
-                'destination': airport_to_dict(dest),
-                'distance': round(distance, 2)
-            })
-    
-    return jsonify({
-        'routes': routes,
-        'count': len(routes)
-    })
+    return static_json_response('routes')
 
 
 @app.route('/api/route/find', methods=['POST'])
@@ -236,7 +592,7 @@ def find_route():
     departure_str = data.get('departure_time')
     if departure_str:
         try:
-            departure_time = datetime.fromisoformat(departure_str)
+            departure_time = parse_iso_datetime(departure_str)
         except ValueError:
             departure_time = datetime.now()
     else:
@@ -280,18 +636,21 @@ def find_all_routes():
         return jsonify({'error': 'Source and destination required'}), 400
     
     try:
-        paths = route_planner.find_all_paths(source_id, dest_id, max_stops)
+        # Only the first 20 paths are returned; the rest are just counted
+        paths = route_planner.iter_paths(source_id, dest_id, max_stops)
+        shown = list(islice(paths, 20))
+        total_found = len(shown) + sum(1 for _ in paths)
         
         return jsonify({
             'success': True,
             'paths': [
                 {
-                    'airports': [airport_to_dict(a) for a in path],
+                    'airports': [airport_to_dict(route_graph.get_node(node_id)) for node_id in path],
                     'stops': len(path) - 2
                 }
-                for path in paths[:20]  # Limit to 20 paths
+                for path in shown
             ],
-            'total_found': len(paths)
+            'total_found': total_found
         })
     
     except ValueError as e:
@@ -311,7 +670,7 @@ def generate_flights():
     base_time_str = data.get('base_time')
     if base_time_str:
         try:
-            base_time = datetime.fromisoformat(base_time_str)
+            base_time = parse_iso_datetime(base_time_str)
         except ValueError:
             base_time = datetime.now()
     else:
@@ -320,26 +679,13 @@ def generate_flights():
     base_time = base_time.replace(second=0, microsecond=0)
     
     # Generate flights
-    origins = ['JFK', 'CDG', 'FRA', 'DXB', 'SIN', 'ORD', 'LAX', 'MAD', 'FCO', 'IST', 'AMS', 'BOS', 'SFO']
-    flights = []
-    
-    for i in range(num_flights):
-        offset = random.randint(-window_minutes, window_minutes)
-        arrival = base_time + timedelta(minutes=offset)
-        
-        flight = Flight(
-            flight_id=f"FL{i+1:03d}",
-            origin=random.choice([o for o in origins if o != destination]),
-            destination=destination,
-            arrival_start=arrival,
-            occupancy_time=random.randint(10, 20),
-            priority=random.randint(1, 10)
-        )
-        flights.append(flight)
+    flights = simulate_arrivals(destination, base_time, num_flights, window_minutes,
+                                GENERATED_FLIGHT_ORIGINS,
+                                occupancy_range=(10, 20), priority_range=(1, 10))
     
     return jsonify({
         'success': True,
-        'flights': [flight_to_dict(f) for f in sorted(flights, key=lambda x: x.arrival_start)],
+        'flights': sorted(flights, key=attrgetter('arrival_start')),
         'count': len(flights),
         'destination': destination
     })
@@ -358,35 +704,22 @@ def schedule_flights():
     if algorithm not in ('dsatur', 'welsh_powell', 'greedy'):
         return jsonify({'error': 'Invalid algorithm. Use: dsatur, welsh_powell, or greedy'}), 400
     
+    if len(data['flights']) > MAX_SCHEDULE_FLIGHTS:
+        return jsonify({'error': f'Too many flights (max {MAX_SCHEDULE_FLIGHTS})'}), 400
+    
     # Parse flights from request
-    flights = []
-    for f_data in data['flights']:
-        try:
-            arrival_start = datetime.fromisoformat(f_data['arrival_start'])
-            flight = Flight(
-                flight_id=f_data['flight_id'],
-                origin=f_data.get('origin', 'UNK'),
-                destination=f_data.get('destination', 'UNK'),
-                arrival_start=arrival_start,
-                occupancy_time=f_data.get('occupancy_time', 15),
-                priority=f_data.get('priority', 5)
-            )
-            flights.append(flight)
-        except (KeyError, ValueError) as e:
-            return jsonify({'error': f'Invalid flight data: {e}'}), 400
+    try:
+        flights = parse_flights(data['flights'])
+    except (KeyError, ValueError) as e:
+        return jsonify({'error': f'Invalid flight data: {e}'}), 400
     
     if not flights:
         return jsonify({'error': 'No valid flights provided'}), 400
     
-    # Build conflict graph for visualization
-    conflict_graph = ConflictGraph()
-    conflict_graph.build_from_flights(flights)
-    
-    conflicts = []
-    for source_id, neighbors in conflict_graph._adjacency_list.items():
-        for dest_id, _ in neighbors:
-            if source_id < dest_id:  # Avoid duplicates
-                conflicts.append({'flight1': source_id, 'flight2': dest_id})
+    if not wants_ndjson():
+        # Re-posted flight lists (e.g. a page refresh) are answered from cache
+        body = schedule_response_body(flights, algorithm)
+        return app.response_class(body, mimetype='application/json')
     
     # Run scheduler
     scheduler = RunwayScheduler(algorithm=algorithm)
@@ -395,13 +728,11 @@ def schedule_flights():
     # Validate schedule
     is_valid, validation_errors = scheduler.validate_schedule(result.flights)
     
-    response = schedule_result_to_dict(result)
-    response['algorithm'] = algorithm
-    response['is_valid'] = is_valid
-    response['validation_errors'] = validation_errors
-    response['conflicts'] = conflicts
-    
-    return jsonify(response)
+    return stream_schedule(result, {
+        'algorithm': algorithm,
+        'is_valid': is_valid,
+        'validation_errors': validation_errors
+    })
 
 
 @app.route('/api/schedule/demo', methods=['POST'])
@@ -415,32 +746,8 @@ def schedule_demo():
     
     # Generate flights around current time
     base_time = datetime.now().replace(second=0, microsecond=0)
-    origins = ['JFK', 'CDG', 'FRA', 'DXB', 'SIN', 'ORD', 'LAX', 'MAD', 'FCO', 'IST']
-    
-    flights = []
-    for i in range(num_flights):
-        offset = random.randint(-45, 45)
-        arrival = base_time + timedelta(minutes=offset)
-        
-        flight = Flight(
-            flight_id=f"FL{i+1:03d}",
-            origin=random.choice([o for o in origins if o != destination]),
-            destination=destination,
-            arrival_start=arrival,
-            occupancy_time=random.randint(10, 18),
-            priority=random.randint(1, 10)
-        )
-        flights.append(flight)
-    
-    # Build conflict graph
-    conflict_graph = ConflictGraph()
-    conflict_graph.build_from_flights(flights)
-    
-    conflicts = []
-    for source_id, neighbors in conflict_graph._adjacency_list.items():
-        for dest_id, _ in neighbors:
-            if source_id < dest_id:
-                conflicts.append({'flight1': source_id, 'flight2': dest_id})
+    flights = simulate_arrivals(destination, base_time, num_flights, 45, DEMO_FLIGHT_ORIGINS,
+                                occupancy_range=(10, 18), priority_range=(1, 10))
     
     # Schedule
     scheduler = RunwayScheduler(algorithm=algorithm)
@@ -451,7 +758,7 @@ def schedule_demo():
     response = schedule_result_to_dict(result)
     response['algorithm'] = algorithm
     response['is_valid'] = is_valid
-    response['conflicts'] = conflicts
+    response['conflicts'] = conflicts_to_dicts(result)
     response['destination'] = destination
     
     return jsonify(response)
@@ -474,68 +781,13 @@ def route_with_scheduling():
     
     departure_time = datetime.now().replace(second=0, microsecond=0)
     
-    # Find route
     try:
-        route_result = route_planner.find_shortest_path(source_id, dest_id, departure_time)
+        response = plan_route_with_scheduling(source_id, dest_id, num_flights, departure_time)
         
-        if not route_result:
+        if response is None:
             return jsonify({'error': f'No route found from {source_id} to {dest_id}'}), 404
         
-        # Generate flights arriving around our ETA
-        our_eta = route_result.eta
-        origins = ['JFK', 'CDG', 'FRA', 'DXB', 'SIN', 'ORD', 'LAX', 'MAD', 'FCO', 'IST', 'AMS']
-        
-        flights = [
-            Flight(
-                flight_id="YOUR_FLIGHT",
-                origin=source_id,
-                destination=dest_id,
-                arrival_start=our_eta,
-                occupancy_time=15,
-                priority=1
-            )
-        ]
-        
-        for i in range(num_flights):
-            offset = random.randint(-30, 30)
-            arrival = our_eta + timedelta(minutes=offset)
-            
-            flight = Flight(
-                flight_id=f"FL{i+1:03d}",
-                origin=random.choice([o for o in origins if o != dest_id and o != source_id]),
-                destination=dest_id,
-                arrival_start=arrival,
-                occupancy_time=random.randint(10, 18),
-                priority=random.randint(2, 8)
-            )
-            flights.append(flight)
-        
-        # Build conflict graph
-        conflict_graph = ConflictGraph()
-        conflict_graph.build_from_flights(flights)
-        
-        conflicts = []
-        for src, neighbors in conflict_graph._adjacency_list.items():
-            for dst, _ in neighbors:
-                if src < dst:
-                    conflicts.append({'flight1': src, 'flight2': dst})
-        
-        # Schedule
-        scheduler = RunwayScheduler(algorithm='dsatur')
-        schedule_result = scheduler.schedule(flights)
-        
-        # Validate schedule
-        is_valid, _ = scheduler.validate_schedule(schedule_result.flights)
-        
-        schedule_response = schedule_result_to_dict(schedule_result)
-        schedule_response['is_valid'] = is_valid
-        schedule_response['conflicts'] = conflicts
-        
-        return jsonify({
-            'route': route_result_to_dict(route_result),
-            'schedule': schedule_response,
-            'your_flight': flight_to_dict(next(f for f in schedule_result.flights if f.flight_id == "YOUR_FLIGHT"))
-        })
+        return jsonify(response)
     
     except ValueError as e:
         return jsonify({'error': str(e)}), 400
@@ -566,7 +818,7 @@ def schedule_pilots():
                 flight_id=fd['flight_id'],
                 origin=fd['origin'],
                 destination=fd['destination'],
-                arrival_start=datetime.fromisoformat(fd['arrival_start']),
+                arrival_start=parse_iso_datetime(fd['arrival_start']),
                 occupancy_time=fd['occupancy_time'],
                 priority=fd.get('priority', 5)
             )
@@ -618,6 +870,33 @@ def server_error(e):
     return jsonify({'error': 'Internal server error'}), 500
 
 
+@app.after_request
+def compress_response(response):
+    """
+    Gzip JSON responses for clients that accept it.
+    
+    Schedule payloads repeat the same keys for every flight, so they
+    compress several times over. Streamed and already-encoded responses
+    are passed through unchanged.
+    """
+    if (response.status_code != 200
+            or response.mimetype != 'application/json'
+            or response.direct_passthrough
+            or response.is_streamed
+            or 'Content-Encoding' in response.headers
+            or not accepts_gzip()):
+        return response
+    
+    body = response.get_data()
+    if len(body) < COMPRESS_MIN_SIZE:
+        return response
+    
+    response.set_data(gzip.compress(body, 6))
+    response.headers['Content-Encoding'] = 'gzip'
+    response.vary.add('Accept-Encoding')
+    return response
+
+
 def create_app():
     """Factory function to create the Flask app."""
     init_data()
@@ -625,9 +904,15 @@ def create_app():
 
 
 if __name__ == '__main__':
+    # Werkzeug development server. For production, run under gunicorn, e.g.
+    #   gunicorn -w $(nproc) -k gthread --threads 4 --preload -b 0.0.0.0:5001 'api.app:create_app()'
+    debug = os.environ.get('FLASK_DEBUG') == '1'
+    
     print("🚀 Starting FlightOptima API Server...")
     init_data()
     print("✅ Data loaded successfully")
     print("📡 API running at http://localhost:5001")
     print("📖 API Docs: http://localhost:5001/api/health")
-    app.run(debug=True, host='0.0.0.0', port=5001)
+    if not debug:
+        print("⚠️  Development server - use gunicorn for production (see README)")
+    app.run(debug=debug, host='0.0.0.0', port=5001, threaded=True)
@@ -72,10 +72,9 @@ def demo_basic_scheduling():
     # Show assignments
     print("\n📋 ASSIGNMENTS:")
     for assignment in sorted(result.assignments, key=lambda a: a.flight_start):
-        duration = (assignment.flight_end - assignment.flight_start).total_seconds() / 3600
         print(f"   {assignment.pilot_id} → {assignment.flight_id}: "
               f"{assignment.flight_start.strftime('%H:%M')} - "
-              f"{assignment.flight_end.strftime('%H:%M')} ({duration:.1f}h)")
+              f"{assignment.flight_end.strftime('%H:%M')} ({assignment.duration_hours:.1f}h)")
     
     # Validate
     is_valid, violations = scheduler.validate_schedule(result.assignments)
@@ -7,15 +7,21 @@ between airports and optimizes runway usage using graph coloring algorithms.
 
 Usage:
     python main.py
+    python main.py --script answers.txt
 
 Author: FlightOptima Team
 Version: 1.0.0
 """
 
+import argparse
+import heapq
 import os
 import sys
+from collections import OrderedDict, defaultdict, deque
 from datetime import datetime, timedelta
-from typing import Optional, List
+from itertools import islice
+from operator import attrgetter
+from typing import Optional, List, Tuple
 import random
 
 # Add src to path for imports
@@ -23,11 +29,10 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from src.models.airport import Airport
 from src.models.flight import Flight
-from src.models.pilot import Pilot, PilotAssignment
-from src.models.graph import RouteGraph, ConflictGraph
+from src.models.graph import RouteGraph
 from src.algorithms.routing import RoutePlanner, RouteResult
 from src.algorithms.scheduling import RunwayScheduler, ScheduleResult
-from src.algorithms.pilot_scheduling import PilotScheduler, PilotScheduleResult
+from src.algorithms.pilot_scheduling import PilotScheduler
 from src.utils.data_loader import DataLoader
 from src.utils.time_utils import TimeUtils
 
@@ -54,53 +59,238 @@ class FlightOptimaApp:
 ╚═══════════════════════════════════════════════════════════════════════════════╝
 """
     
-    def __init__(self):
-        """Initialize the application."""
+    # Erase display and move the cursor home
+    CLEAR_SCREEN = "\x1b[2J\x1b[H"
+    
+    # Main menu, composed once
+    MENU_TEXT = "\n".join([
+        "",
+        "=" * 60,
+        "                      MAIN MENU",
+        "=" * 60,
+        "",
+        "  [1] 📂 Load Airport & Route Data",
+        "  [2] 🗺️  Find Shortest Route Between Airports",
+        "  [3] ✈️  View All Available Airports",
+        "  [4] 🔍 Find All Possible Routes",
+        "  [5] 📅 Load Flight Schedule for Scheduling",
+        "  [6] 🎲 Generate Random Flights for Simulation",
+        "  [7] 🛬 Run Runway Scheduler",
+        "  [8] �‍✈️  Run Ethical Pilot Scheduler",
+        "  [9] 📊 Full Demo (Route + Scheduling + Pilots)",
+        "  [10] ℹ️  Help & About",
+        "  [0] 🚪 Exit",
+        "",
+        "=" * 60,
+        "",
+    ])
+    
+    # Help & about screen
+    HELP_TEXT = "\n" + "=" * 60 + """
+                    HELP & ABOUT
+""" + "=" * 60 + """
+
+FlightOptima v1.0.0 - Route Planner, Runway Scheduler & Pilot Scheduler
+
+ABOUT:
+------
+FlightOptima is a backend simulation tool that:
+  • Calculates optimal flight paths using Dijkstra's Algorithm
+  • Schedules runway usage using Graph Coloring algorithms
+  • Assigns pilots ethically with FAA-compliant rest requirements
+  • Resolves scheduling conflicts automatically
+
+ALGORITHMS:
+-----------
+1. Routing (Dijkstra's Algorithm):
+   - Finds shortest weighted path in the airport graph
+   - Considers distance and weather factors
+   - Uses priority queue for efficiency (O(E log V))
+
+2. Runway Scheduling (Graph Coloring):
+   - DSatur: Prioritizes vertices by saturation degree
+   - Welsh-Powell: Orders by vertex degree
+   - Greedy: Processes in time order
+   - Minimizes number of runways needed
+
+3. Pilot Scheduling (Ethical Assignment):
+   - Respects FAA duty time limits (8 hours max)
+   - Enforces minimum rest periods (10 hours)
+   - Fair workload distribution across pilots
+   - Strategies: Least Busy, Most Available, Round Robin
+
+FAA REGULATIONS:
+----------------
+  • Maximum duty hours: 8 hours per day
+  • Minimum rest period: 10 hours between flights
+  • All schedules validated for compliance
+
+DATA FILES:
+-----------
+  • airports.csv: Airport definitions (ID, Name, Lat, Long)
+  • routes.csv: Route connections (Source, Dest, Distance)
+  • simulated_schedules.json: Pre-defined flight schedules
+
+QUICK START:
+------------
+  1. Load data (Option 1)
+  2. Find a route (Option 2)
+  3. Generate flights (Option 6)
+  4. Run runway scheduler (Option 7)
+  5. Run pilot scheduler (Option 8)
+  
+  OR use Full Demo (Option 9) for guided walkthrough!
+
+TIPS:
+-----
+  • Airport codes are case-insensitive (JFK = jfk)
+  • Weather factor > 1.0 means bad weather (longer travel)
+  • Lower priority number = higher priority
+  • More pilots = better compliance rate
+
+"""
+    
+    # Airport table row (ID, name cut to 35 chars, lat, long, weather)
+    AIRPORT_ROW_FORMAT = "{:<6} {:<35.35} {:>8.4f} {:>9.4f} {:>8.2f}".format
+    
+    # Origins used for simulated traffic
+    RANDOM_FLIGHT_ORIGINS = ('JFK', 'CDG', 'FRA', 'DXB', 'SIN', 'ORD', 'LAX', 'MAD', 'FCO', 'IST', 'AMS')
+    DEMO_FLIGHT_ORIGINS = ('CDG', 'FRA', 'DXB', 'SIN', 'ORD', 'MAD', 'FCO', 'IST', 'AMS', 'BOS')
+    
+    # Most shortest-route results kept by find_shortest_path
+    ROUTE_CACHE_SIZE = 64
+    
+    # Menu choice -> handler method name
+    MENU_ACTIONS = {
+        '1': 'load_data',
+        '2': 'find_route',
+        '3': 'view_airports',
+        '4': 'find_all_routes',
+        '5': 'load_flights',
+        '6': 'generate_random_flights',
+        '7': 'run_scheduler',
+        '8': 'run_pilot_scheduler',
+        '9': 'run_full_demo',
+        '10': 'show_help',
+    }
+    
+    def __init__(self, script: Optional[List[str]] = None):
+        """
+        Initialize the application.
+        
+        Args:
+            script: Answers to replay instead of reading stdin, one per
+                prompt (menu choices included). Runs non-interactively.
+        """
+        self._script = deque(script) if script is not None else None
         self.data_loader = DataLoader()
         self.route_graph: Optional[RouteGraph] = None
         self.route_planner: Optional[RoutePlanner] = None
+        self.airport_codes: frozenset = frozenset()
+        self.airports_sorted: Tuple[Airport, ...] = ()
+        self.route_count = 0
         self.scheduler = RunwayScheduler(algorithm='dsatur')
         self.pilot_scheduler = PilotScheduler(min_rest_hours=10.0, max_daily_hours=8.0)
         self.flights: List[Flight] = []
         self.last_route_result: Optional[RouteResult] = None
+        self._route_cache: "OrderedDict[Tuple[str, str, datetime, float], Optional[RouteResult]]" = OrderedDict()
         self.last_schedule_result: Optional[ScheduleResult] = None
         
+        if os.name == 'nt':
+            # Turns on ANSI escape handling in the Windows console
+            os.system('')
+        
+    @property
+    def interactive(self) -> bool:
+        """Check whether input comes from the user rather than a script."""
+        return self._script is None
+    
     def clear_screen(self):
-        """Clear the terminal screen."""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        """Clear the terminal screen with ANSI escapes (no subprocess)."""
+        # Escapes would only litter scripted runs and redirected output
+        if not self.interactive or not sys.stdout.isatty():
+            return
+        sys.stdout.write(self.CLEAR_SCREEN)
+        sys.stdout.flush()
     
     def print_banner(self):
         """Print the application banner."""
-        print(self.BANNER)
+        sys.stdout.write(self.BANNER + "\n")
     
     def print_menu(self):
         """Print the main menu."""
-        print("\n" + "=" * 60)
-        print("                      MAIN MENU")
-        print("=" * 60)
-        print("\n  [1] 📂 Load Airport & Route Data")
-        print("  [2] 🗺️  Find Shortest Route Between Airports")
-        print("  [3] ✈️  View All Available Airports")
-        print("  [4] 🔍 Find All Possible Routes")
-        print("  [5] 📅 Load Flight Schedule for Scheduling")
-        print("  [6] 🎲 Generate Random Flights for Simulation")
-        print("  [7] 🛬 Run Runway Scheduler")
-        print("  [8] �‍✈️  Run Ethical Pilot Scheduler")
-        print("  [9] 📊 Full Demo (Route + Scheduling + Pilots)")
-        print("  [10] ℹ️  Help & About")
-        print("  [0] 🚪 Exit")
-        print("\n" + "=" * 60)
+        sys.stdout.write(self.MENU_TEXT)
     
     def get_input(self, prompt: str, default: str = None) -> str:
-        """Get user input with optional default value."""
+        """
+        Get user input with optional default value.
+        
+        In scripted mode the next script line is used (and echoed) instead
+        of reading stdin; an empty line selects the default.
+        
+        Raises:
+            EOFError: If the script has run out of lines
+        """
+        if not self.interactive:
+            if not self._script:
+                raise EOFError("End of script")
+            user_input = self._script.popleft().strip()
+            print(f"{prompt}: {user_input}")
+            return user_input or default or ''
+        
         if default:
             user_input = input(f"{prompt} [{default}]: ").strip()
             return user_input if user_input else default
         return input(f"{prompt}: ").strip()
     
     def wait_for_enter(self):
-        """Wait for user to press Enter."""
-        input("\n⏎ Press Enter to continue...")
+        """Wait for user to press Enter (skipped in scripted mode)."""
+        if self.interactive:
+            input("\n⏎ Press Enter to continue...")
+    
+    def set_route_graph(self, route_graph: RouteGraph):
+        """
+        Install a loaded route graph along with its planner and lookups.
+        
+        The graph is not modified after loading, so the airport listing
+        and counts are derived here once rather than on every menu visit.
+        """
+        self.route_graph = route_graph
+        self.route_planner = RoutePlanner(route_graph)
+        self.airport_codes = frozenset(route_graph.nodes)
+        self.airports_sorted = tuple(sorted(route_graph.get_all_airports(), key=attrgetter('id')))
+        self.route_count = len(route_graph.get_all_edges())
+        self._route_cache.clear()
+    
+    def find_shortest_path(self, source: str, dest: str,
+                           dep_time: datetime) -> Optional[RouteResult]:
+        """
+        Find the shortest route, reusing the result of an identical query.
+        
+        Departure times entered in the CLI have minute resolution, so
+        repeated lookups of the same trip skip Dijkstra entirely. The cache
+        is reset whenever a new route graph is installed, and holds at most
+        ROUTE_CACHE_SIZE results, dropping the least recently used.
+        """
+        key = (source, dest, dep_time, self.route_planner.cruising_speed)
+        cache = self._route_cache
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+        
+        result = cache[key] = self.route_planner.find_shortest_path(source, dest, dep_time)
+        if len(cache) > self.ROUTE_CACHE_SIZE:
+            cache.popitem(last=False)
+        return result
+    
+    def set_flights(self, flights: List[Flight]):
+        """
+        Store the working flight list, ordered by arrival time.
+        
+        Sorting once here lets the listings print self.flights directly and
+        hands the schedulers input that is already in the order they sort to.
+        """
+        self.flights = sorted(flights, key=attrgetter('arrival_start'))
     
     def load_data(self):
         """Load airport and route data from CSV files."""
@@ -118,18 +308,13 @@ class FlightOptimaApp:
                 self.data_loader.create_sample_data()
             
             print("\n📂 Loading airports from airports.csv...")
-            self.route_graph = self.data_loader.load_route_graph(
+            self.set_route_graph(self.data_loader.load_route_graph(
                 bidirectional=True,
                 calculate_distance=False  # Use distances from CSV
-            )
+            ))
             
-            airports = self.route_graph.get_all_airports()
-            edges = self.route_graph.get_all_edges()
-            
-            print(f"✅ Loaded {len(airports)} airports")
-            print(f"✅ Loaded {len(edges)} routes")
-            
-            self.route_planner = RoutePlanner(self.route_graph)
+            print(f"✅ Loaded {len(self.airports_sorted)} airports")
+            print(f"✅ Loaded {self.route_count} routes")
             
             print("\n🎉 Data loaded successfully!")
             
@@ -149,14 +334,17 @@ class FlightOptimaApp:
         print("               AVAILABLE AIRPORTS")
         print("-" * 60)
         
-        airports = sorted(self.route_graph.get_all_airports(), key=lambda a: a.id)
+        airports = self.airports_sorted
         
         print(f"\n{'ID':<6} {'Name':<35} {'Lat':>8} {'Long':>9} {'Weather':>8}")
         print("-" * 70)
         
-        for airport in airports:
-            print(f"{airport.id:<6} {airport.name[:35]:<35} {airport.latitude:>8.4f} "
-                  f"{airport.longitude:>9.4f} {airport.weather_factor:>8.2f}")
+        row = self.AIRPORT_ROW_FORMAT
+        print("\n".join(
+            row(airport.id, airport.name, airport.latitude,
+                airport.longitude, airport.weather_factor)
+            for airport in airports
+        ))
         
         print(f"\nTotal: {len(airports)} airports")
         self.wait_for_enter()
@@ -174,14 +362,14 @@ class FlightOptimaApp:
         
         # Get source airport
         source = self.get_input("\n🛫 Enter source airport code (e.g., JFK)").upper()
-        if not self.route_graph.has_node(source):
+        if source not in self.airport_codes:
             print(f"\n❌ Airport '{source}' not found!")
             self.wait_for_enter()
             return
         
         # Get destination airport
         dest = self.get_input("🛬 Enter destination airport code (e.g., LHR)").upper()
-        if not self.route_graph.has_node(dest):
+        if dest not in self.airport_codes:
             print(f"\n❌ Airport '{dest}' not found!")
             self.wait_for_enter()
             return
@@ -195,10 +383,7 @@ class FlightOptimaApp:
         dep_input = self.get_input("🕐 Enter departure time (HH:MM) or press Enter for now", 
                                    datetime.now().strftime("%H:%M"))
         try:
-            dep_time = datetime.strptime(dep_input, "%H:%M")
-            dep_time = datetime.now().replace(
-                hour=dep_time.hour, minute=dep_time.minute, second=0, microsecond=0
-            )
+            dep_time = TimeUtils.parse_clock_time(dep_input)
         except ValueError:
             dep_time = datetime.now()
         
@@ -212,7 +397,7 @@ class FlightOptimaApp:
         
         print("\n🔍 Calculating optimal route...")
         
-        result = self.route_planner.find_shortest_path(source, dest, dep_time)
+        result = self.find_shortest_path(source, dest, dep_time)
         
         if result:
             self.last_route_result = result
@@ -234,13 +419,13 @@ class FlightOptimaApp:
         print("-" * 60)
         
         source = self.get_input("\n🛫 Enter source airport code").upper()
-        if not self.route_graph.has_node(source):
+        if source not in self.airport_codes:
             print(f"\n❌ Airport '{source}' not found!")
             self.wait_for_enter()
             return
         
         dest = self.get_input("🛬 Enter destination airport code").upper()
-        if not self.route_graph.has_node(dest):
+        if dest not in self.airport_codes:
             print(f"\n❌ Airport '{dest}' not found!")
             self.wait_for_enter()
             return
@@ -249,18 +434,21 @@ class FlightOptimaApp:
         
         print("\n🔍 Finding all possible routes...")
         
-        paths = self.route_planner.find_all_paths(source, dest, max_stops)
+        # Only the first 10 routes are shown; the rest are just counted
+        paths = self.route_planner.iter_paths(source, dest, max_stops)
+        shown = list(islice(paths, 10))
+        total = len(shown) + sum(1 for _ in paths)
         
-        if paths:
-            print(f"\n✅ Found {len(paths)} possible route(s):\n")
+        if shown:
+            print(f"\n✅ Found {total} possible route(s):\n")
             
-            for i, path in enumerate(paths[:10], 1):  # Limit to first 10
-                path_str = " -> ".join(a.id for a in path)
+            for i, path in enumerate(shown, 1):
+                path_str = " -> ".join(path)
                 stops = len(path) - 2
                 print(f"  {i}. {path_str} ({stops} stop{'s' if stops != 1 else ''})")
             
-            if len(paths) > 10:
-                print(f"\n  ... and {len(paths) - 10} more routes")
+            if total > 10:
+                print(f"\n  ... and {total - 10} more routes")
         else:
             print(f"\n❌ No routes found from {source} to {dest}")
         
@@ -274,15 +462,17 @@ class FlightOptimaApp:
         
         try:
             filename = self.get_input("\n📂 Enter filename", "simulated_schedules.json")
-            self.flights = self.data_loader.load_flights(filename)
+            self.set_flights(self.data_loader.load_flights(filename))
             
             print(f"\n✅ Loaded {len(self.flights)} flights")
             print("\n" + "-" * 50)
             
-            for flight in sorted(self.flights, key=lambda f: f.arrival_start):
-                print(f"  {flight.flight_id}: {flight.origin} -> {flight.destination} | "
-                      f"Arrival: {flight.arrival_start.strftime('%H:%M')} | "
-                      f"Duration: {flight.occupancy_time}min")
+            print("\n".join(
+                f"  {flight.flight_id}: {flight.origin} -> {flight.destination} | "
+                f"Arrival: {TimeUtils.format_clock_time(flight.arrival_start)} | "
+                f"Duration: {flight.occupancy_time}min"
+                for flight in self.flights
+            ))
             
         except FileNotFoundError as e:
             print(f"\n❌ File not found: {e}")
@@ -291,6 +481,46 @@ class FlightOptimaApp:
         
         self.wait_for_enter()
     
+    def _generate_flights(self, dest: str, base_time: datetime, count: int,
+                          window: int, origins: Tuple[str, ...],
+                          priority_range: Tuple[int, int],
+                          id_digits: int) -> List[Flight]:
+        """
+        Generate random arrivals at an airport around a base time.
+        
+        Each random attribute is drawn for all flights in one call.
+        
+        Args:
+            dest: Destination airport code
+            base_time: Center of the arrival window
+            count: Number of flights to generate
+            window: Arrivals fall within ±window minutes of base_time
+            origins: Candidate origin airports (dest is excluded)
+            priority_range: Inclusive (lowest, highest) priority numbers
+            id_digits: Zero-padded width of the numeric flight ID
+            
+        Returns:
+            List of generated Flight objects
+        """
+        candidate_origins = [o for o in origins if o != dest]
+        
+        offsets = random.choices(range(-window, window + 1), k=count)
+        occupancies = random.choices(range(10, 21), k=count)
+        priorities = random.choices(range(priority_range[0], priority_range[1] + 1), k=count)
+        flight_origins = random.choices(candidate_origins, k=count)
+        
+        return [
+            Flight(
+                flight_id=f"FL{i + 1:0{id_digits}d}",
+                origin=flight_origins[i],
+                destination=dest,
+                arrival_start=base_time + timedelta(minutes=offsets[i]),
+                occupancy_time=occupancies[i],
+                priority=priorities[i]
+            )
+            for i in range(count)
+        ]
+    
     def generate_random_flights(self):
         """Generate random flights for simulation."""
         print("\n" + "-" * 60)
@@ -314,30 +544,22 @@ class FlightOptimaApp:
         
         # Generate flights
         base_time = datetime.now().replace(second=0, microsecond=0)
-        self.flights = []
         
-        origins = ['JFK', 'CDG', 'FRA', 'DXB', 'SIN', 'ORD', 'LAX', 'MAD', 'FCO', 'IST', 'AMS']
-        
-        for i in range(num_flights):
-            flight = Flight.generate_random(
-                destination=dest,
-                base_time=base_time,
-                flight_number=i + 1,
-                max_offset_minutes=window,
-                occupancy_range=(10, 20)
-            )
-            # Assign a random origin
-            flight.origin = random.choice([o for o in origins if o != dest])
-            self.flights.append(flight)
+        self.set_flights(self._generate_flights(
+            dest, base_time, num_flights, window, self.RANDOM_FLIGHT_ORIGINS,
+            priority_range=(1, 10), id_digits=4
+        ))
         
         print(f"\n✅ Generated {len(self.flights)} random flights arriving at {dest}\n")
         print("-" * 60)
         
-        for flight in sorted(self.flights, key=lambda f: f.arrival_start):
-            print(f"  {flight.flight_id}: {flight.origin} -> {flight.destination} | "
-                  f"Arrival: {flight.arrival_start.strftime('%H:%M')} - "
-                  f"{flight.arrival_end.strftime('%H:%M')} | "
-                  f"Priority: {flight.priority}")
+        print("\n".join(
+            f"  {flight.flight_id}: {flight.origin} -> {flight.destination} | "
+            f"Arrival: {TimeUtils.format_clock_time(flight.arrival_start)} - "
+            f"{TimeUtils.format_clock_time(flight.arrival_end)} | "
+            f"Priority: {flight.priority}"
+            for flight in self.flights
+        ))
         
         self.wait_for_enter()
     
@@ -363,12 +585,12 @@ class FlightOptimaApp:
         algorithms = {'1': 'dsatur', '2': 'welsh_powell', '3': 'greedy'}
         algorithm = algorithms.get(choice, 'dsatur')
         
-        self.scheduler = RunwayScheduler(algorithm=algorithm)
+        self.scheduler.set_algorithm(algorithm)
         
         print(f"\n🔄 Running {algorithm.upper()} algorithm...")
         
         # Schedule flights
-        result = self.scheduler.schedule(self.flights.copy())
+        result = self.scheduler.schedule(self.flights)
         self.last_schedule_result = result
         
         print("\n" + str(result))
@@ -424,6 +646,7 @@ class FlightOptimaApp:
         # Create pilots
         print(f"\n👥 Creating {num_pilots} pilots...")
         pilots = self.pilot_scheduler.create_pilots(num_pilots, base_airport='HUB')
+        pilots_by_id = {p.pilot_id: p for p in pilots}
         
         print(f"✅ Created {len(pilots)} pilots\n")
         for pilot in pilots[:5]:  # Show first 5
@@ -444,7 +667,7 @@ class FlightOptimaApp:
         print(f"\n🔄 Running {strategy.replace('_', ' ').title()} scheduling algorithm...")
         
         # Schedule pilots to flights
-        result = self.pilot_scheduler.schedule(self.flights.copy(), strategy=strategy)
+        result = self.pilot_scheduler.schedule(self.flights, strategy=strategy)
         
         print("\n" + str(result))
         
@@ -454,32 +677,35 @@ class FlightOptimaApp:
             print("-" * 60)
             
             # Group by pilot
-            pilot_assignments = {}
+            pilot_assignments = defaultdict(list)
             for assignment in result.assignments:
-                if assignment.pilot_id not in pilot_assignments:
-                    pilot_assignments[assignment.pilot_id] = []
                 pilot_assignments[assignment.pilot_id].append(assignment)
             
-            for pilot_id in sorted(pilot_assignments.keys()):
-                assignments = sorted(pilot_assignments[pilot_id], key=lambda a: a.flight_start)
-                pilot = next((p for p in pilots if p.pilot_id == pilot_id), None)
+            # Collect the whole listing and print it in one write
+            lines = []
+            for pilot_id in sorted(pilot_assignments):
+                assignments = pilot_assignments[pilot_id]
+                assignments.sort(key=attrgetter('flight_start'))
+                pilot = pilots_by_id.get(pilot_id)
                 
                 if pilot:
-                    print(f"\n{pilot.name} ({pilot_id}):")
-                    print(f"  Total Hours: {pilot.total_hours_today:.1f}/{pilot.max_daily_hours:.1f}h")
-                    print(f"  Assignments:")
+                    lines.append(f"\n{pilot.name} ({pilot_id}):")
+                    lines.append(f"  Total Hours: {pilot.total_hours_today:.1f}/{pilot.max_daily_hours:.1f}h")
+                    lines.append("  Assignments:")
                     
-                    for i, assignment in enumerate(assignments, 1):
-                        duration = (assignment.flight_end - assignment.flight_start).total_seconds() / 3600
-                        print(f"    {i}. Flight {assignment.flight_id}: "
-                              f"{assignment.flight_start.strftime('%H:%M')} - "
-                              f"{assignment.flight_end.strftime('%H:%M')} ({duration:.1f}h)")
+                    # Pair each assignment with its successor to get the rest gap
+                    followers = assignments[1:] + [None]
+                    for i, (assignment, next_assignment) in enumerate(zip(assignments, followers), 1):
+                        lines.append(f"    {i}. Flight {assignment.flight_id}: "
+                                     f"{TimeUtils.format_clock_time(assignment.flight_start)} - "
+                                     f"{TimeUtils.format_clock_time(assignment.flight_end)} ({assignment.duration_hours:.1f}h)")
                         
                         # Check rest time before next flight
-                        if i < len(assignments):
-                            next_assignment = assignments[i]
+                        if next_assignment is not None:
                             rest_hours = (next_assignment.flight_start - assignment.flight_end).total_seconds() / 3600
-                            print(f"       Rest before next flight: {rest_hours:.1f}h")
+                            lines.append(f"       Rest before next flight: {rest_hours:.1f}h")
+            
+            print("\n".join(lines))
         
         # Validate schedule
         print("\n" + "-" * 60)
@@ -530,11 +756,10 @@ class FlightOptimaApp:
         if not self.route_planner:
             print("\n📂 Loading airport and route data...")
             try:
-                self.route_graph = self.data_loader.load_route_graph(
+                self.set_route_graph(self.data_loader.load_route_graph(
                     bidirectional=True,
                     calculate_distance=False
-                )
-                self.route_planner = RoutePlanner(self.route_graph)
+                ))
                 print("✅ Data loaded successfully!")
             except Exception as e:
                 print(f"❌ Error loading data: {e}")
@@ -549,7 +774,7 @@ class FlightOptimaApp:
         source = self.get_input("\n🛫 Enter source airport", "JFK").upper()
         dest = self.get_input("🛬 Enter destination airport", "LHR").upper()
         
-        if not self.route_graph.has_node(source) or not self.route_graph.has_node(dest):
+        if source not in self.airport_codes or dest not in self.airport_codes:
             print("❌ Invalid airport code!")
             self.wait_for_enter()
             return
@@ -558,7 +783,7 @@ class FlightOptimaApp:
         
         print(f"\n🔍 Finding optimal route from {source} to {dest}...")
         
-        result = self.route_planner.find_shortest_path(source, dest, dep_time)
+        result = self.find_shortest_path(source, dest, dep_time)
         
         if result:
             print("\n" + str(result))
@@ -582,7 +807,7 @@ class FlightOptimaApp:
         our_eta = result.eta
         
         # Generate other flights around the same time
-        self.flights = [
+        flights = [
             Flight(
                 flight_id="YOUR_FLIGHT",
                 origin=source,
@@ -593,31 +818,24 @@ class FlightOptimaApp:
             )
         ]
         
-        origins = ['CDG', 'FRA', 'DXB', 'SIN', 'ORD', 'MAD', 'FCO', 'IST', 'AMS', 'BOS']
+        flights.extend(self._generate_flights(
+            dest, our_eta, max(num_flights - 1, 0), 30, self.DEMO_FLIGHT_ORIGINS,
+            priority_range=(2, 8), id_digits=3
+        ))
         
-        for i in range(num_flights - 1):
-            offset = random.randint(-30, 30)
-            arrival = our_eta + timedelta(minutes=offset)
-            
-            flight = Flight(
-                flight_id=f"FL{i+1:03d}",
-                origin=random.choice([o for o in origins if o != dest]),
-                destination=dest,
-                arrival_start=arrival,
-                occupancy_time=random.randint(10, 20),
-                priority=random.randint(2, 8)
-            )
-            self.flights.append(flight)
+        self.set_flights(flights)
         
         print(f"\n✅ Generated {len(self.flights)} flights (including yours)")
         print("\nIncoming flights at", dest + ":")
         print("-" * 50)
         
-        for flight in sorted(self.flights, key=lambda f: f.arrival_start):
-            marker = ">>> " if flight.flight_id == "YOUR_FLIGHT" else "    "
-            print(f"{marker}{flight.flight_id}: {flight.origin} -> {flight.destination} | "
-                  f"{flight.arrival_start.strftime('%H:%M')} - "
-                  f"{flight.arrival_end.strftime('%H:%M')}")
+        print("\n".join(
+            f"{'>>> ' if flight.flight_id == 'YOUR_FLIGHT' else '    '}"
+            f"{flight.flight_id}: {flight.origin} -> {flight.destination} | "
+            f"{TimeUtils.format_clock_time(flight.arrival_start)} - "
+            f"{TimeUtils.format_clock_time(flight.arrival_end)}"
+            for flight in self.flights
+        ))
         
         # Step 3: Run scheduler
         print("\n" + "-" * 50)
@@ -626,7 +844,8 @@ class FlightOptimaApp:
         
         print("\n🔄 Running DSatur graph coloring algorithm...")
         
-        schedule_result = self.scheduler.schedule(self.flights.copy())
+        self.scheduler.set_algorithm('dsatur')
+        schedule_result = self.scheduler.schedule(self.flights)
         
         print(f"\n✅ Scheduling complete!")
         print(f"\n🛬 Minimum Runways Needed: {schedule_result.num_runways}")
@@ -638,8 +857,8 @@ class FlightOptimaApp:
         our_flight = next((f for f in schedule_result.flights if f.flight_id == "YOUR_FLIGHT"), None)
         if our_flight:
             print(f"\n🎉 YOUR FLIGHT has been assigned to RUNWAY {our_flight.runway_id}")
-            print(f"   Landing window: {our_flight.arrival_start.strftime('%H:%M')} - "
-                  f"{our_flight.arrival_end.strftime('%H:%M')}")
+            print(f"   Landing window: {TimeUtils.format_clock_time(our_flight.arrival_start)} - "
+                  f"{TimeUtils.format_clock_time(our_flight.arrival_end)}")
         
         # Step 4: Pilot Scheduling
         print("\n" + "-" * 50)
@@ -657,10 +876,11 @@ class FlightOptimaApp:
         
         self.pilot_scheduler = PilotScheduler(min_rest_hours=10.0, max_daily_hours=8.0)
         pilots = self.pilot_scheduler.create_pilots(num_pilots, base_airport=dest)
+        pilots_by_id = {p.pilot_id: p for p in pilots}
         
         print(f"\n🔄 Assigning pilots to flights (Least Busy strategy)...")
         
-        pilot_result = self.pilot_scheduler.schedule(self.flights.copy(), strategy='least_busy')
+        pilot_result = self.pilot_scheduler.schedule(self.flights, strategy='least_busy')
         
         print(f"\n✅ Pilot scheduling complete!")
         print(f"   • Assigned: {len(pilot_result.assignments)} flights")
@@ -673,23 +893,26 @@ class FlightOptimaApp:
             print("PILOT ASSIGNMENTS:")
             
             # Group by pilot
-            pilot_assignments = {}
+            pilot_assignments = defaultdict(list)
             for assignment in pilot_result.assignments:
-                if assignment.pilot_id not in pilot_assignments:
-                    pilot_assignments[assignment.pilot_id] = []
                 pilot_assignments[assignment.pilot_id].append(assignment)
             
-            for pilot_id in sorted(pilot_assignments.keys()):
+            # Collect the whole listing and print it in one write
+            lines = []
+            for pilot_id in sorted(pilot_assignments):
                 assignments = pilot_assignments[pilot_id]
-                pilot = next((p for p in pilots if p.pilot_id == pilot_id), None)
+                pilot = pilots_by_id.get(pilot_id)
                 
                 if pilot:
-                    print(f"\n  {pilot.name} ({pilot_id}): {len(assignments)} flight(s)")
-                    for assignment in sorted(assignments, key=lambda a: a.flight_start)[:3]:
+                    lines.append(f"\n  {pilot.name} ({pilot_id}): {len(assignments)} flight(s)")
+                    # Only the first three are shown, so don't sort the rest
+                    for assignment in heapq.nsmallest(3, assignments, key=attrgetter('flight_start')):
                         marker = ">>> " if assignment.flight_id == "YOUR_FLIGHT" else "    "
-                        print(f"  {marker}{assignment.flight_id}: "
-                              f"{assignment.flight_start.strftime('%H:%M')} - "
-                              f"{assignment.flight_end.strftime('%H:%M')}")
+                        lines.append(f"  {marker}{assignment.flight_id}: "
+                                     f"{TimeUtils.format_clock_time(assignment.flight_start)} - "
+                                     f"{TimeUtils.format_clock_time(assignment.flight_end)}")
+            
+            print("\n".join(lines))
         
         # Validation
         is_valid, violations = self.pilot_scheduler.validate_schedule(pilot_result.assignments)
@@ -705,70 +928,7 @@ class FlightOptimaApp:
     
     def show_help(self):
         """Display help information."""
-        print("\n" + "=" * 60)
-        print("                    HELP & ABOUT")
-        print("=" * 60)
-        
-        print("""
-FlightOptima v1.0.0 - Route Planner, Runway Scheduler & Pilot Scheduler
-
-ABOUT:
-------
-FlightOptima is a backend simulation tool that:
-  • Calculates optimal flight paths using Dijkstra's Algorithm
-  • Schedules runway usage using Graph Coloring algorithms
-  • Assigns pilots ethically with FAA-compliant rest requirements
-  • Resolves scheduling conflicts automatically
-
-ALGORITHMS:
------------
-1. Routing (Dijkstra's Algorithm):
-   - Finds shortest weighted path in the airport graph
-   - Considers distance and weather factors
-   - Uses priority queue for efficiency (O(E log V))
-
-2. Runway Scheduling (Graph Coloring):
-   - DSatur: Prioritizes vertices by saturation degree
-   - Welsh-Powell: Orders by vertex degree
-   - Greedy: Processes in time order
-   - Minimizes number of runways needed
-
-3. Pilot Scheduling (Ethical Assignment):
-   - Respects FAA duty time limits (8 hours max)
-   - Enforces minimum rest periods (10 hours)
-   - Fair workload distribution across pilots
-   - Strategies: Least Busy, Most Available, Round Robin
-
-FAA REGULATIONS:
-----------------
-  • Maximum duty hours: 8 hours per day
-  • Minimum rest period: 10 hours between flights
-  • All schedules validated for compliance
-
-DATA FILES:
------------
-  • airports.csv: Airport definitions (ID, Name, Lat, Long)
-  • routes.csv: Route connections (Source, Dest, Distance)
-  • simulated_schedules.json: Pre-defined flight schedules
-
-QUICK START:
-------------
-  1. Load data (Option 1)
-  2. Find a route (Option 2)
-  3. Generate flights (Option 6)
-  4. Run runway scheduler (Option 7)
-  5. Run pilot scheduler (Option 8)
-  
-  OR use Full Demo (Option 9) for guided walkthrough!
-
-TIPS:
------
-  • Airport codes are case-insensitive (JFK = jfk)
-  • Weather factor > 1.0 means bad weather (longer travel)
-  • Lower priority number = higher priority
-  • More pilots = better compliance rate
-""")
-        
+        sys.stdout.write(self.HELP_TEXT)
         self.wait_for_enter()
     
     def run(self):
@@ -779,33 +939,22 @@ TIPS:
         while True:
             self.print_menu()
             
-            choice = self.get_input("\n👉 Enter your choice")
-            
-            if choice == '1':
-                self.load_data()
-            elif choice == '2':
-                self.find_route()
-            elif choice == '3':
-                self.view_airports()
-            elif choice == '4':
-                self.find_all_routes()
-            elif choice == '5':
-                self.load_flights()
-            elif choice == '6':
-                self.generate_random_flights()
-            elif choice == '7':
-                self.run_scheduler()
-            elif choice == '8':
-                self.run_pilot_scheduler()
-            elif choice == '9':
-                self.run_full_demo()
-            elif choice == '10':
-                self.show_help()
-            elif choice == '0':
-                print("\n👋 Thank you for using FlightOptima! Safe travels! ✈️\n")
+            try:
+                choice = self.get_input("\n👉 Enter your choice")
+                
+                if choice == '0':
+                    print("\n👋 Thank you for using FlightOptima! Safe travels! ✈️\n")
+                    break
+                
+                action = self.MENU_ACTIONS.get(choice)
+                if action:
+                    getattr(self, action)()
+                else:
+                    print("\n⚠️  Invalid choice. Please try again.")
+            except EOFError:
+                # Input closed or script finished
+                print("\n👋 Goodbye!\n")
                 break
-            else:
-                print("\n⚠️  Invalid choice. Please try again.")
             
             self.clear_screen()
             self.print_banner()
@@ -813,8 +962,20 @@ TIPS:
 
 def main():
     """Entry point for the application."""
+    parser = argparse.ArgumentParser(description="FlightOptima: Route Planner & Runway Scheduler")
+    parser.add_argument(
+        '--script', metavar='FILE',
+        help="replay answers from FILE (one per line, '#' for comments) instead of prompting"
+    )
+    args = parser.parse_args()
+    
+    script = None
+    if args.script:
+        with open(args.script, 'r', encoding='utf-8') as f:
+            script = [line.rstrip('\n') for line in f if not line.startswith('#')]
+    
     try:
-        app = FlightOptimaApp()
+        app = FlightOptimaApp(script=script)
         app.run()
     except KeyboardInterrupt:
         print("\n\n👋 Goodbye!\n")
@@ -6,12 +6,16 @@ and ensures sufficient rest periods between flight assignments.
 """
 
 from dataclasses import dataclass, field
+from collections import defaultdict
 from typing import Dict, List, Tuple, Optional, Set
 from datetime import datetime, timedelta
+from operator import attrgetter
+import heapq
 import random
 
 from ..models.pilot import Pilot, PilotAssignment
 from ..models.flight import Flight
+from ..utils.time_utils import TimeUtils
 
 
 @dataclass
@@ -50,25 +54,26 @@ class PilotScheduleResult:
             result.append("-" * 40)
             
             # Sort by flight start time
-            sorted_assignments = sorted(self.assignments, key=lambda a: a.flight_start)
-            
-            for assignment in sorted_assignments:
-                result.append(f"  {assignment}")
+            sorted_assignments = sorted(self.assignments, key=attrgetter('flight_start'))
+            result.extend(f"  {assignment}" for assignment in sorted_assignments)
         
         if self.pilot_utilization:
             result.append("\nPILOT UTILIZATION:")
             result.append("-" * 40)
-            for pilot_id, util in sorted(self.pilot_utilization.items()):
-                result.append(f"  Pilot {pilot_id}: {util:.1f}%")
+            result.extend(
+                f"  Pilot {pilot_id}: {util:.1f}%"
+                for pilot_id, util in sorted(self.pilot_utilization.items())
+            )
         
         if self.unassigned_flights:
             result.append("\nUNASSIGNED FLIGHTS:")
             result.append("-" * 40)
-            for flight in self.unassigned_flights:
-                result.append(
-                    f"  {flight.flight_id}: {flight.origin} -> {flight.destination} at "
-                    f"{flight.arrival_start.strftime('%H:%M')}"
-                )
+            clock = TimeUtils.format_clock_time
+            result.extend(
+                f"  {flight.flight_id}: {flight.origin} -> {flight.destination} at "
+                f"{clock(flight.arrival_start)}"
+                for flight in self.unassigned_flights
+            )
         
         result.append("\n" + "=" * 70)
         return "\n".join(result)
@@ -81,14 +86,15 @@ class PilotScheduleResult:
             "+----------+----------+--------+-------+-------------+-------------+",
         ]
         
-        sorted_assignments = sorted(self.assignments, key=lambda a: a.flight_start)
+        sorted_assignments = sorted(self.assignments, key=attrgetter('flight_start'))
         
-        for assignment in sorted_assignments:
-            lines.append(
-                f"| {assignment.flight_id:8} | {assignment.pilot_id:8} | "
-                f"{assignment.flight_start.strftime('%H:%M'):11} | "
-                f"{assignment.flight_end.strftime('%H:%M'):11} |"
-            )
+        clock = TimeUtils.format_clock_time
+        lines.extend(
+            f"| {assignment.flight_id:8} | {assignment.pilot_id:8} | "
+            f"{clock(assignment.flight_start):11} | "
+            f"{clock(assignment.flight_end):11} |"
+            for assignment in sorted_assignments
+        )
         
         lines.append("+----------+----------+--------+-------+-------------+-------------+")
         return "\n".join(lines)
@@ -104,6 +110,24 @@ class PilotScheduler:
     - Fair workload distribution
     """
     
+    # Strategy -> key pilots are ranked by (lowest first, ties in roster
+    # order); unknown strategies take the first available pilot
+    STRATEGY_KEYS = {
+        # Prefer pilot with fewest hours today (fairness)
+        'least_busy': lambda p: p.total_hours_today,
+        # Prefer pilot with most remaining hours
+        'most_available': lambda p: -p.get_remaining_hours(),
+        # Prefer pilot with fewest assignments
+        'round_robin': lambda p: len(p.assigned_flights),
+    }
+    
+    # Names given to pilots from create_pilots, numbered once they run out
+    PILOT_NAMES = tuple(f"Capt. {surname}" for surname in (
+        "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller",
+        "Davis", "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez",
+        "Wilson", "Anderson", "Thomas", "Taylor", "Moore", "Jackson", "Martin"
+    ))
+    
     def __init__(self, min_rest_hours: float = 10.0, max_daily_hours: float = 8.0):
         """
         Initialize the pilot scheduler.
@@ -136,15 +160,11 @@ class PilotScheduler:
         Returns:
             List of created Pilot objects
         """
-        names = [
-            "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", 
-            "Davis", "Rodriguez", "Martinez", "Hernandez", "Lopez", "Gonzalez",
-            "Wilson", "Anderson", "Thomas", "Taylor", "Moore", "Jackson", "Martin"
-        ]
+        names = self.PILOT_NAMES
         
         pilots = []
         for i in range(count):
-            name = f"Capt. {names[i % len(names)]}"
+            name = names[i % len(names)]
             if i >= len(names):
                 name += f" {i // len(names) + 1}"
             
@@ -176,47 +196,48 @@ class PilotScheduler:
         duration_minutes = flight.occupancy_time + 30  # Add prep time
         return duration_minutes / 60.0
     
-    def _find_available_pilot(self, flight: Flight, strategy: str = 'least_busy') -> Optional[Pilot]:
+    def _find_available_pilot(self, rested: List[Tuple[float, int]],
+                              flight_start: datetime, duration: float) -> Optional[int]:
         """
         Find an available pilot for a flight.
         
+        Pops rested pilots in strategy order until one passes Pilot.can_fly,
+        the same check assign_flight makes; the ones passed over go back
+        on the heap.
+        
         Args:
-            flight: Flight to assign
-            strategy: Selection strategy ('least_busy', 'most_available', 'round_robin')
+            rested: Heap of (strategy key, roster index) for pilots whose
+                rest period has (about) ended by the flight's start
+            flight_start: Start time of the flight
+            duration: Flight duration in hours
             
         Returns:
-            Available Pilot or None if no pilot is available
+            Roster index of the available pilot (removed from the heap),
+            or None if no pilot is available
         """
-        duration = self._calculate_flight_duration(flight)
-        available_pilots = []
-        
-        for pilot in self._pilots:
-            if pilot.can_fly(flight.arrival_start, duration):
-                available_pilots.append(pilot)
-        
-        if not available_pilots:
-            return None
-        
-        # Apply selection strategy
-        if strategy == 'least_busy':
-            # Prefer pilot with fewest hours today (fairness)
-            return min(available_pilots, key=lambda p: p.total_hours_today)
+        passed_over = []
+        found = None
         
-        elif strategy == 'most_available':
-            # Prefer pilot with most remaining hours
-            return max(available_pilots, key=lambda p: p.get_remaining_hours())
+        while rested:
+            entry = heapq.heappop(rested)
+            pilot = self._pilots[entry[1]]
+            if pilot.can_fly(flight_start, duration):
+                found = entry[1]
+                break
+            passed_over.append(entry)
         
-        elif strategy == 'round_robin':
-            # Prefer pilot with fewest assignments
-            return min(available_pilots, key=lambda p: len(p.assigned_flights))
+        for entry in passed_over:
+            heapq.heappush(rested, entry)
         
-        else:
-            return available_pilots[0]
+        return found
     
     def schedule(self, flights: List[Flight], strategy: str = 'least_busy') -> PilotScheduleResult:
         """
         Schedule pilots to flights using ethical constraints.
         
+        The flight list is only read, never reordered or resized, so
+        callers can pass their own list without copying it.
+        
         Args:
             flights: List of Flight objects to assign pilots to
             strategy: Assignment strategy ('least_busy', 'most_available', 'round_robin')
@@ -231,7 +252,7 @@ class PilotScheduler:
             # No pilots available
             return PilotScheduleResult(
                 assignments=[],
-                unassigned_flights=flights,
+                unassigned_flights=list(flights),
                 compliance_rate=0.0
             )
         
@@ -245,25 +266,49 @@ class PilotScheduler:
         unassigned_flights: List[Flight] = []
         
         # Sort flights by start time (greedy scheduling)
-        sorted_flights = sorted(flights, key=lambda f: f.arrival_start)
+        sorted_flights = sorted(flights, key=attrgetter('arrival_start'))
+        
+        # Pilots only become free to fly again as flight start times move
+        # forward, so rather than checking every pilot for every flight,
+        # keep the rested ones in a heap ordered by the strategy and the
+        # resting ones in a heap ordered by when their rest ends. A pilot's
+        # strategy key only changes when they fly, i.e. while resting.
+        # get_availability_time() is rounded to the microsecond while
+        # can_fly() compares float hours, so pilots are released slightly
+        # early and can_fly() makes the final call.
+        strategy_key = self.STRATEGY_KEYS.get(strategy, lambda p: 0)
+        rested = [(strategy_key(pilot), index) for index, pilot in enumerate(self._pilots)]
+        heapq.heapify(rested)
+        resting: List[Tuple[datetime, int]] = []
+        
+        # All assignments in one run are made at the same time
+        assignment_time = datetime.now()
+        
+        release_slack = timedelta(milliseconds=1)
         
         for flight in sorted_flights:
-            pilot = self._find_available_pilot(flight, strategy)
+            while resting and resting[0][0] <= flight.arrival_start + release_slack:
+                index = heapq.heappop(resting)[1]
+                heapq.heappush(rested, (strategy_key(self._pilots[index]), index))
+            
+            duration = self._calculate_flight_duration(flight)
+            index = self._find_available_pilot(rested, flight.arrival_start, duration)
             
-            if pilot is None:
+            if index is None:
                 unassigned_flights.append(flight)
                 continue
             
             # Assign pilot to flight
-            duration = self._calculate_flight_duration(flight)
+            pilot = self._pilots[index]
             flight_end = flight.arrival_start + timedelta(hours=duration)
             
             pilot.assign_flight(flight.flight_id, flight.arrival_start, flight_end, duration)
+            heapq.heappush(resting, (pilot.get_availability_time(), index))
             
             assignment = PilotAssignment(
                 pilot_id=pilot.pilot_id,
                 flight_id=flight.flight_id,
-                assignment_time=datetime.now(),
+                assignment_time=assignment_time,
                 flight_start=flight.arrival_start,
                 flight_end=flight_end
             )
@@ -302,22 +347,20 @@ class PilotScheduler:
         violations = []
         
         # Group assignments by pilot
-        pilot_assignments: Dict[str, List[PilotAssignment]] = {}
+        pilot_assignments: Dict[str, List[PilotAssignment]] = defaultdict(list)
         for assignment in assignments:
-            if assignment.pilot_id not in pilot_assignments:
-                pilot_assignments[assignment.pilot_id] = []
             pilot_assignments[assignment.pilot_id].append(assignment)
         
         # Check each pilot's schedule
-        for pilot_id, pilot_assign in pilot_assignments.items():
-            # Sort by flight start time
-            sorted_assign = sorted(pilot_assign, key=lambda a: a.flight_start)
+        by_start = attrgetter('flight_start')
+        for pilot_id, sorted_assign in pilot_assignments.items():
+            # Sort by flight start time; the grouped lists are our own, so
+            # sort in place. Assignments from schedule() are already in
+            # order, which the sort detects in a single linear pass.
+            sorted_assign.sort(key=by_start)
             
             # Check total hours
-            total_hours = sum(
-                (a.flight_end - a.flight_start).total_seconds() / 3600
-                for a in sorted_assign
-            )
+            total_hours = sum(a.duration_hours for a in sorted_assign)
             
             if total_hours > self.max_daily_hours:
                 violations.append(
@@ -325,10 +368,7 @@ class PilotScheduler:
                 )
             
             # Check rest periods
-            for i in range(len(sorted_assign) - 1):
-                current = sorted_assign[i]
-                next_flight = sorted_assign[i + 1]
-                
+            for current, next_flight in zip(sorted_assign, sorted_assign[1:]):
                 rest_time = (next_flight.flight_start - current.flight_end).total_seconds() / 3600
                 
                 if rest_time < self.min_rest_hours:
@@ -364,12 +404,16 @@ class PilotScheduler:
         Returns:
             Dictionary of statistics
         """
-        total_pilots = len(self._pilots)
-        active_pilots = sum(1 for p in self._pilots if p.assigned_flights)
+        # Collect the hours once; the reductions then run over plain lists
+        hours = [p.total_hours_today for p in self._pilots]
+        active_hours = [p.total_hours_today for p in self._pilots if p.assigned_flights]
+        
+        total_pilots = len(hours)
+        active_pilots = len(active_hours)
         
-        avg_hours = sum(p.total_hours_today for p in self._pilots) / total_pilots if total_pilots > 0 else 0
-        max_hours = max((p.total_hours_today for p in self._pilots), default=0)
-        min_hours = min((p.total_hours_today for p in self._pilots if p.assigned_flights), default=0)
+        avg_hours = sum(hours) / total_pilots if total_pilots > 0 else 0
+        max_hours = max(hours, default=0)
+        min_hours = min(active_hours, default=0)
         
         return {
             'total_pilots': total_pilots,
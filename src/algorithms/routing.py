@@ -6,7 +6,7 @@ algorithm with a priority queue for efficient shortest path calculation.
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 from datetime import datetime, timedelta
 import heapq
 
@@ -87,6 +87,11 @@ class RoutePlanner:
         """Get the route graph."""
         return self._graph
     
+    @property
+    def cruising_speed(self) -> float:
+        """Get the aircraft cruising speed in km/h."""
+        return self._cruising_speed
+    
     def set_cruising_speed(self, speed: float) -> None:
         """
         Set the aircraft cruising speed.
@@ -98,20 +103,22 @@ class RoutePlanner:
             raise ValueError("Cruising speed must be positive")
         self._cruising_speed = speed
     
-    def dijkstra(self, source_id: str, destination_id: str) -> Tuple[Dict[str, float], Dict[str, Optional[str]]]:
+    def dijkstra(self, source_id: str,
+                 destination_id: Optional[str] = None) -> Tuple[Dict[str, float], Dict[str, Optional[str]]]:
         """
         Implement Dijkstra's algorithm to find shortest paths.
         
         Args:
             source_id: Source airport ID
-            destination_id: Destination airport ID
+            destination_id: Destination airport ID, or None to find the
+                shortest paths to every airport
             
         Returns:
             Tuple of (distances dict, predecessors dict)
         """
         if not self._graph.has_node(source_id):
             raise ValueError(f"Source airport '{source_id}' not found")
-        if not self._graph.has_node(destination_id):
+        if destination_id is not None and not self._graph.has_node(destination_id):
             raise ValueError(f"Destination airport '{destination_id}' not found")
         
         # Initialize distances with infinity
@@ -123,32 +130,31 @@ class RoutePlanner:
         
         # Priority queue: (distance, node_id)
         pq = [(0, source_id)]
-        visited = set()
+        
+        # Bound locally; these are looked up once per edge in the loop below
+        get_neighbors = self._graph.get_neighbors
+        heappush, heappop = heapq.heappush, heapq.heappop
         
         while pq:
-            current_dist, current_id = heapq.heappop(pq)
+            current_dist, current_id = heappop(pq)
             
-            # Skip if already processed
-            if current_id in visited:
+            # Skip stale queue entries; a settled node is never improved on,
+            # so this also stands in for a separate visited set
+            if current_dist > distances[current_id]:
                 continue
             
-            visited.add(current_id)
-            
             # Early termination if destination reached
             if current_id == destination_id:
                 break
             
             # Explore neighbors
-            for neighbor_id, weight in self._graph.get_neighbors(current_id):
-                if neighbor_id in visited:
-                    continue
-                
+            for neighbor_id, weight in get_neighbors(current_id):
                 new_dist = current_dist + weight
                 
                 if new_dist < distances[neighbor_id]:
                     distances[neighbor_id] = new_dist
                     predecessors[neighbor_id] = current_id
-                    heapq.heappush(pq, (new_dist, neighbor_id))
+                    heappush(pq, (new_dist, neighbor_id))
         
         return distances, predecessors
     
@@ -227,33 +233,108 @@ class RoutePlanner:
         Returns:
             List of paths, where each path is a list of Airport objects
         """
-        if not self._graph.has_node(source_id) or not self._graph.has_node(destination_id):
-            return []
+        get_node = self._graph.get_node
+        return [
+            [get_node(node_id) for node_id in path]
+            for path in self.iter_paths(source_id, destination_id, max_stops)
+        ]
+    
+    def iter_paths(self, source_id: str, destination_id: str,
+                   max_stops: int = 5) -> Iterator[Tuple[str, ...]]:
+        """
+        Lazily yield the paths between two airports (up to max_stops).
         
-        all_paths = []
+        Same search as find_all_paths, but paths are produced one at a
+        time as airport ID tuples, so callers that only show the first few
+        (or just count them) never build the full list of Airport paths.
+        Branches are cut as soon as the remaining hops to the destination
+        (from a reverse BFS) can no longer fit within max_stops, so the
+        search only walks prefixes of paths it will actually yield.
         
-        def dfs(current: str, path: List[str], visited: set):
-            if len(path) > max_stops + 2:  # source + max_stops + destination
-                return
-            
-            if current == destination_id:
-                # Convert path to Airport objects
-                airport_path = [self._graph.get_node(node_id) for node_id in path]
-                all_paths.append(airport_path)
-                return
+        Args:
+            source_id: Source airport ID
+            destination_id: Destination airport ID
+            max_stops: Maximum number of intermediate stops
             
-            for neighbor_id, _ in self._graph.get_neighbors(current):
-                if neighbor_id not in visited:
-                    visited.add(neighbor_id)
-                    path.append(neighbor_id)
-                    dfs(neighbor_id, path, visited)
-                    path.pop()
-                    visited.remove(neighbor_id)
+        Yields:
+            Tuples of airport IDs from source to destination
+        """
+        if not self._graph.has_node(source_id) or not self._graph.has_node(destination_id):
+            return
         
+        max_length = max_stops + 2  # source + max_stops + destination
+        hops_to_dest = self._hops_to(destination_id, max_length - 1)
+        
+        if source_id == destination_id:
+            yield (source_id,)
+            return
+        
+        # Depth-first search with an explicit stack of neighbor iterators,
+        # one per airport on the current path, instead of recursion
+        get_neighbors = self._graph.get_neighbors
+        path = [source_id]
         visited = {source_id}
-        dfs(source_id, [source_id], visited)
+        stack = [iter(get_neighbors(source_id))]
+        
+        while stack:
+            for neighbor_id, _ in stack[-1]:
+                if neighbor_id in visited:
+                    continue
+                
+                # Skip neighbors that cannot reach the destination in time
+                hops = hops_to_dest.get(neighbor_id)
+                if hops is None or len(path) + 1 + hops > max_length:
+                    continue
+                
+                if neighbor_id == destination_id:
+                    yield (*path, neighbor_id)
+                    continue
+                
+                # Descend into this neighbor; its siblings resume afterwards
+                visited.add(neighbor_id)
+                path.append(neighbor_id)
+                stack.append(iter(get_neighbors(neighbor_id)))
+                break
+            else:
+                # Every neighbor explored, so backtrack
+                stack.pop()
+                visited.remove(path.pop())
+    
+    def _hops_to(self, destination_id: str, max_hops: int) -> Dict[str, int]:
+        """
+        Get the fewest hops from each airport to a destination.
         
-        return all_paths
+        Runs a breadth-first search over reversed routes, stopping at
+        max_hops. Airports that cannot reach the destination within that
+        many hops are left out.
+        
+        Args:
+            destination_id: Destination airport ID
+            max_hops: Maximum number of hops to search
+            
+        Returns:
+            Dict mapping airport ID to hop count (0 for the destination)
+        """
+        incoming: Dict[str, List[str]] = {}
+        for node_id in self._graph.nodes:
+            for neighbor_id, _ in self._graph.get_neighbors(node_id):
+                incoming.setdefault(neighbor_id, []).append(node_id)
+        
+        hops = {destination_id: 0}
+        frontier = [destination_id]
+        
+        for depth in range(1, max_hops + 1):
+            next_frontier = []
+            for node_id in frontier:
+                for prev_id in incoming.get(node_id, ()):
+                    if prev_id not in hops:
+                        hops[prev_id] = depth
+                        next_frontier.append(prev_id)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+        
+        return hops
     
     def get_reachable_airports(self, source_id: str, max_distance: float = None) -> List[Tuple[Airport, float]]:
         """
@@ -266,27 +347,8 @@ class RoutePlanner:
         Returns:
             List of (Airport, distance) tuples sorted by distance
         """
-        distances, _ = self.dijkstra(source_id, source_id)  # Run to all nodes
-        
         # Run full Dijkstra (we need to visit all nodes)
-        distances = {node_id: float('inf') for node_id in self._graph.nodes}
-        distances[source_id] = 0
-        pq = [(0, source_id)]
-        visited = set()
-        
-        while pq:
-            current_dist, current_id = heapq.heappop(pq)
-            
-            if current_id in visited:
-                continue
-            visited.add(current_id)
-            
-            for neighbor_id, weight in self._graph.get_neighbors(current_id):
-                if neighbor_id not in visited:
-                    new_dist = current_dist + weight
-                    if new_dist < distances[neighbor_id]:
-                        distances[neighbor_id] = new_dist
-                        heapq.heappush(pq, (new_dist, neighbor_id))
+        distances, _ = self.dijkstra(source_id)
         
         results = []
         for node_id, dist in distances.items():
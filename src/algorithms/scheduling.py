@@ -6,11 +6,16 @@ This module implements the Runway Scheduler using graph coloring algorithms
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Tuple, Optional, Set
+from typing import Dict, Iterator, List, Tuple, Optional, Set
 from datetime import datetime
+from operator import attrgetter
+from bisect import bisect_left
+from collections import defaultdict
+import heapq
 
 from ..models.flight import Flight
 from ..models.graph import ConflictGraph
+from ..utils.time_utils import TimeUtils
 
 
 @dataclass
@@ -21,13 +26,16 @@ class ScheduleResult:
     Attributes:
         flights: List of scheduled flights with runway assignments
         num_runways: Minimum number of runways needed
-        runway_assignments: Dict mapping runway_id to list of flights
+        runway_assignments: Dict mapping runway_id to list of flights,
+            each list ordered by arrival time
         conflicts_resolved: Number of conflicts resolved
+        conflict_edges: (flight_id, flight_id) pairs of conflicting flights
     """
     flights: List[Flight]
     num_runways: int
     runway_assignments: Dict[int, List[Flight]] = field(default_factory=dict)
     conflicts_resolved: int = 0
+    conflict_edges: List[Tuple[str, str]] = field(default_factory=list)
     
     def __str__(self) -> str:
         result = [
@@ -40,23 +48,35 @@ class ScheduleResult:
             "-" * 70,
         ]
         
+        clock = TimeUtils.format_clock_time
+        
         for runway_id in sorted(self.runway_assignments.keys()):
             flights = self.runway_assignments[runway_id]
             result.append(f"\nRUNWAY {runway_id}:")
             result.append("-" * 40)
-            
-            # Sort flights by arrival time
-            sorted_flights = sorted(flights, key=lambda f: f.arrival_start)
-            
-            for flight in sorted_flights:
-                result.append(
-                    f"  {flight.flight_id}: {flight.origin} -> {flight.destination} | "
-                    f"{flight.arrival_start.strftime('%H:%M')} - {flight.arrival_end.strftime('%H:%M')}"
-                )
+            result.extend(
+                f"  {flight.flight_id}: {flight.origin} -> {flight.destination} | "
+                f"{clock(flight.arrival_start)} - {clock(flight.arrival_end)}"
+                for flight in flights
+            )
         
         result.append("\n" + "=" * 70)
         return "\n".join(result)
     
+    def iter_flights_by_arrival(self) -> Iterator[Flight]:
+        """
+        Iterate over all scheduled flights in arrival order.
+        
+        Each runway's list is already in arrival order, so they are merged
+        rather than re-sorted. When the runway lists do not account for
+        every flight (e.g. a hand-built result), all flights are sorted
+        instead so none are dropped.
+        """
+        by_arrival = attrgetter('arrival_start')
+        if sum(map(len, self.runway_assignments.values())) == len(self.flights):
+            return heapq.merge(*self.runway_assignments.values(), key=by_arrival)
+        return iter(sorted(self.flights, key=by_arrival))
+    
     def get_schedule_table(self) -> str:
         """Generate a formatted schedule table."""
         lines = [
@@ -65,14 +85,13 @@ class ScheduleResult:
             "+----------+--------+-------+-------------+-------------+--------+",
         ]
         
-        sorted_flights = sorted(self.flights, key=lambda f: f.arrival_start)
-        
-        for flight in sorted_flights:
-            lines.append(
-                f"| {flight.flight_id:8} | {flight.origin:6} | {flight.destination:5} | "
-                f"{flight.arrival_start.strftime('%H:%M'):11} | "
-                f"{flight.arrival_end.strftime('%H:%M'):11} | {flight.runway_id:6} |"
-            )
+        clock = TimeUtils.format_clock_time
+        lines.extend(
+            f"| {flight.flight_id:8} | {flight.origin:6} | {flight.destination:5} | "
+            f"{clock(flight.arrival_start):11} | "
+            f"{clock(flight.arrival_end):11} | {flight.runway_id:6} |"
+            for flight in self.iter_flights_by_arrival()
+        )
         
         lines.append("+----------+--------+-------+-------------+-------------+--------+")
         return "\n".join(lines)
@@ -86,6 +105,13 @@ class RunwayScheduler:
     (with overlapping time windows) share the same runway.
     """
     
+    # Algorithm name -> coloring method
+    COLORING_METHODS = {
+        'welsh_powell': 'welsh_powell',
+        'dsatur': 'dsatur',
+        'greedy': 'greedy_coloring',
+    }
+    
     def __init__(self, algorithm: str = "dsatur"):
         """
         Initialize the runway scheduler.
@@ -93,25 +119,58 @@ class RunwayScheduler:
         Args:
             algorithm: Coloring algorithm to use ('welsh_powell' or 'dsatur')
         """
-        self._algorithm = algorithm.lower()
-        if self._algorithm not in ('welsh_powell', 'dsatur', 'greedy'):
-            raise ValueError(f"Unknown algorithm: {algorithm}. Use 'welsh_powell', 'dsatur', or 'greedy'")
-        
         self._conflict_graph: Optional[ConflictGraph] = None
+        self._conflict_graph_key: Optional[tuple] = None
+        self._prepared_graph: Optional[ConflictGraph] = None
+        self._arrival_order: List[int] = []
+        self._conflict_edges: List[Tuple[str, str]] = []
+        self._colorings: Dict[str, Dict[str, int]] = {}
+        self.set_algorithm(algorithm)
+    
+    @property
+    def algorithm(self) -> str:
+        """Get the coloring algorithm in use."""
+        return self._algorithm
+    
+    def set_algorithm(self, algorithm: str) -> None:
+        """
+        Switch the coloring algorithm.
+        
+        The last conflict graph is kept, so rescheduling the same flights
+        with another algorithm does not rebuild it, and switching back to
+        an algorithm already run on it reuses that coloring.
+        
+        Args:
+            algorithm: 'welsh_powell', 'dsatur', or 'greedy'
+        """
+        method_name = self.COLORING_METHODS.get(algorithm.lower())
+        if method_name is None:
+            raise ValueError(f"Unknown algorithm: {algorithm}. Use 'welsh_powell', 'dsatur', or 'greedy'")
+        self._algorithm = algorithm.lower()
+        # Bind the coloring method once instead of dispatching per schedule
+        self._color = getattr(self, method_name)
     
     def build_conflict_graph(self, flights: List[Flight]) -> ConflictGraph:
         """
         Build a conflict graph from flights.
         
+        Reuses the previous graph when the flights and their time windows
+        are unchanged.
+        
         Args:
             flights: List of Flight objects
             
         Returns:
             ConflictGraph with edges between conflicting flights
         """
+        key = tuple((f.flight_id, f.arrival_start, f.arrival_end) for f in flights)
+        if self._conflict_graph is not None and key == self._conflict_graph_key:
+            return self._conflict_graph
+        
         graph = ConflictGraph()
         graph.build_from_flights(flights)
         self._conflict_graph = graph
+        self._conflict_graph_key = key
         return graph
     
     def welsh_powell(self, graph: ConflictGraph) -> Dict[str, int]:
@@ -127,28 +186,25 @@ class RunwayScheduler:
             Dict mapping flight_id to color (runway) number
         """
         # Get all flights sorted by degree (descending)
-        flights = graph.get_all_flights()
-        sorted_flights = sorted(
-            flights,
-            key=lambda f: graph.get_degree(f.flight_id),
-            reverse=True
-        )
+        flight_ids = [f.flight_id for f in graph.get_all_flights()]
+        sorted_ids = sorted(flight_ids, key=graph.get_degree, reverse=True)
         
         colors: Dict[str, int] = {}
         
-        for flight in sorted_flights:
+        for flight_id in sorted_ids:
             # Find colors used by neighbors
-            neighbor_colors: Set[int] = set()
-            for neighbor_id, _ in graph.get_neighbors(flight.flight_id):
-                if neighbor_id in colors:
-                    neighbor_colors.add(colors[neighbor_id])
+            neighbor_colors = {
+                colors[neighbor_id]
+                for neighbor_id, _ in graph.get_neighbors(flight_id)
+                if neighbor_id in colors
+            }
             
             # Assign smallest available color
             color = 1
             while color in neighbor_colors:
                 color += 1
             
-            colors[flight.flight_id] = color
+            colors[flight_id] = color
         
         return colors
     
@@ -174,28 +230,22 @@ class RunwayScheduler:
         
         colors: Dict[str, int] = {}
         saturation: Dict[str, Set[int]] = {f.flight_id: set() for f in flights}
-        uncolored = set(f.flight_id for f in flights)
-        
-        while uncolored:
-            # Select vertex with max saturation, break ties by degree
-            max_sat = -1
-            max_degree = -1
-            selected = None
-            
-            for flight_id in uncolored:
-                sat = len(saturation[flight_id])
-                degree = graph.get_degree(flight_id)
-                
-                if sat > max_sat or (sat == max_sat and degree > max_degree):
-                    max_sat = sat
-                    max_degree = degree
-                    selected = flight_id
+        degree: Dict[str, int] = {f.flight_id: graph.get_degree(f.flight_id) for f in flights}
+        order: Dict[str, int] = {f.flight_id: i for i, f in enumerate(flights)}
+        
+        # Max-heap on (saturation, degree), ties broken by input order.
+        # A vertex is re-pushed whenever its saturation grows, so entries
+        # whose saturation no longer matches are stale and skipped.
+        heap = [(0, -degree[fid], order[fid], fid) for fid in order]
+        heapq.heapify(heap)
+        
+        while heap:
+            neg_sat, _, _, selected = heapq.heappop(heap)
+            if selected in colors or -neg_sat != len(saturation[selected]):
+                continue
             
-            # Find colors used by neighbors
-            neighbor_colors: Set[int] = set()
-            for neighbor_id, _ in graph.get_neighbors(selected):
-                if neighbor_id in colors:
-                    neighbor_colors.add(colors[neighbor_id])
+            # Colors used by neighbors are exactly this vertex's saturation
+            neighbor_colors = saturation[selected]
             
             # Assign smallest available color
             color = 1
@@ -203,12 +253,13 @@ class RunwayScheduler:
                 color += 1
             
             colors[selected] = color
-            uncolored.remove(selected)
             
             # Update saturation of uncolored neighbors
             for neighbor_id, _ in graph.get_neighbors(selected):
-                if neighbor_id in uncolored:
+                if neighbor_id not in colors and color not in saturation[neighbor_id]:
                     saturation[neighbor_id].add(color)
+                    heapq.heappush(heap, (-len(saturation[neighbor_id]), -degree[neighbor_id],
+                                          order[neighbor_id], neighbor_id))
         
         return colors
     
@@ -216,7 +267,13 @@ class RunwayScheduler:
         """
         Simple greedy graph coloring algorithm.
         
-        Processes vertices in arrival time order.
+        Processes vertices in arrival time order. In that order the
+        already-colored neighbors of a flight are exactly the flights still
+        occupying a runway when it arrives, so instead of scanning the
+        adjacency list the runways are tracked with two heaps: occupied
+        runways by release time, and released runways by number. Each
+        flight takes the lowest-numbered free runway, which is the same
+        color the neighbor scan would pick, in O(n log n).
         
         Args:
             graph: ConflictGraph to color
@@ -224,22 +281,26 @@ class RunwayScheduler:
         Returns:
             Dict mapping flight_id to color (runway) number
         """
-        flights = sorted(graph.get_all_flights(), key=lambda f: f.arrival_start)
+        flights = sorted(graph.get_all_flights(), key=attrgetter('arrival_start'))
         colors: Dict[str, int] = {}
+        occupied: List[Tuple[datetime, int]] = []  # (arrival_end, color)
+        free: List[int] = []
+        num_colors = 0
         
         for flight in flights:
-            # Find colors used by neighbors
-            neighbor_colors: Set[int] = set()
-            for neighbor_id, _ in graph.get_neighbors(flight.flight_id):
-                if neighbor_id in colors:
-                    neighbor_colors.add(colors[neighbor_id])
+            # Release runways cleared before this flight arrives
+            while occupied and occupied[0][0] <= flight.arrival_start:
+                heapq.heappush(free, heapq.heappop(occupied)[1])
             
             # Assign smallest available color
-            color = 1
-            while color in neighbor_colors:
-                color += 1
+            if free:
+                color = heapq.heappop(free)
+            else:
+                num_colors += 1
+                color = num_colors
             
             colors[flight.flight_id] = color
+            heapq.heappush(occupied, (flight.arrival_end, color))
         
         return colors
     
@@ -247,6 +308,10 @@ class RunwayScheduler:
         """
         Schedule flights to runways using graph coloring.
         
+        The list is only read (and sorted into new lists), never reordered
+        or resized, so callers can pass their own list without copying it.
+        Each flight's runway_id is set to its assigned runway.
+        
         Args:
             flights: List of Flight objects to schedule
             
@@ -256,40 +321,64 @@ class RunwayScheduler:
         if not flights:
             return ScheduleResult(flights=[], num_runways=0)
         
-        # Build conflict graph
-        graph = self.build_conflict_graph(flights)
-        
-        # Count conflicts
-        conflicts = len(graph.get_all_edges())
+        # Build conflict graph, plus the parts shared by every algorithm
+        graph, arrival_order, conflict_edges = self._prepare(flights)
         
-        # Apply coloring algorithm
-        if self._algorithm == 'welsh_powell':
-            colors = self.welsh_powell(graph)
-        elif self._algorithm == 'dsatur':
-            colors = self.dsatur(graph)
-        else:
-            colors = self.greedy_coloring(graph)
+        # Apply coloring algorithm (the colorings are deterministic, so one
+        # already computed for this graph is reused)
+        colors = self._colorings.get(self._algorithm)
+        if colors is None:
+            colors = self._colorings[self._algorithm] = self._color(graph)
         
-        # Assign runways to flights
-        runway_assignments: Dict[int, List[Flight]] = {}
-        
-        for flight in flights:
+        # Every coloring uses the smallest free color, so runways 1..max
+        # are all in use and their lists can be created up front
+        num_runways = max(colors.values()) if colors else 0
+        runway_assignments: Dict[int, List[Flight]] = {
+            runway_id: [] for runway_id in range(1, num_runways + 1)
+        }
+        
+        # Assign runways to flights, walking them in arrival order so each
+        # runway's list comes out already sorted
+        for index in arrival_order:
+            flight = flights[index]
             runway_id = colors.get(flight.flight_id, 1)
             flight.runway_id = runway_id
-            
-            if runway_id not in runway_assignments:
-                runway_assignments[runway_id] = []
             runway_assignments[runway_id].append(flight)
         
-        num_runways = max(colors.values()) if colors else 0
-        
         return ScheduleResult(
             flights=flights,
             num_runways=num_runways,
             runway_assignments=runway_assignments,
-            conflicts_resolved=conflicts
+            conflicts_resolved=len(conflict_edges),
+            conflict_edges=list(conflict_edges)
         )
     
+    def _prepare(self, flights: List[Flight]) -> Tuple[ConflictGraph, List[int], List[Tuple[str, str]]]:
+        """
+        Get the algorithm-independent inputs for scheduling a flight list.
+        
+        The arrival order (as positions in flights) and the conflict pairs
+        are derived from the conflict graph, so they are cached with it and
+        rescheduling the same flights with another algorithm reuses them.
+        Colorings of the previous graph are dropped when it changes.
+        
+        Args:
+            flights: List of Flight objects
+            
+        Returns:
+            Tuple of (conflict graph, flight positions by arrival,
+            (flight_id, flight_id) conflict pairs)
+        """
+        graph = self.build_conflict_graph(flights)
+        
+        if self._prepared_graph is not graph:
+            self._arrival_order = sorted(range(len(flights)), key=lambda i: flights[i].arrival_start)
+            self._conflict_edges = [(a, b) for a, b, _ in graph.get_all_edges()]
+            self._colorings = {}
+            self._prepared_graph = graph
+        
+        return graph, self._arrival_order, self._conflict_edges
+    
     def get_chromatic_number_bound(self, flights: List[Flight]) -> Tuple[int, int]:
         """
         Calculate bounds on the chromatic number (minimum runways).
@@ -303,17 +392,21 @@ class RunwayScheduler:
         if not flights:
             return 0, 0
         
-        graph = self.build_conflict_graph(flights)
-        
-        # Lower bound: maximum degree + 1 (clique number)
-        _, max_degree = graph.get_max_degree()
-        lower_bound = 1  # At least 1 runway needed
-        
-        # Find maximum clique size (simplified - just use max degree)
-        # This is an approximation
-        lower_bound = max(1, max_degree)
+        # Lower bound: clique number, which for time windows is the peak
+        # number of flights on the ground at once. Sweep arrivals in order
+        # with a min-heap of runway clearance times, reusing the runway
+        # that frees up first whenever it is already clear.
+        clearances: List[datetime] = []
+        for flight in sorted(flights, key=attrgetter('arrival_start')):
+            if clearances and clearances[0] <= flight.arrival_start:
+                heapq.heapreplace(clearances, flight.arrival_end)
+            else:
+                heapq.heappush(clearances, flight.arrival_end)
+        lower_bound = len(clearances)
         
         # Upper bound: max_degree + 1 (by greedy coloring theorem)
+        graph = self.build_conflict_graph(flights)
+        _, max_degree = graph.get_max_degree()
         upper_bound = max_degree + 1
         
         return lower_bound, upper_bound
@@ -322,22 +415,39 @@ class RunwayScheduler:
         """
         Validate that a schedule has no conflicts.
         
+        Flights are grouped by runway and sorted by arrival; the flights
+        sharing a runway with one flight that arrive before it clears form
+        a contiguous run found by binary search, so only actual conflicts
+        are visited rather than every pair of flights.
+        
         Args:
             flights: List of scheduled Flight objects
             
         Returns:
             Tuple of (is_valid, list of conflict descriptions)
         """
-        conflicts = []
-        n = len(flights)
+        by_runway: Dict[Optional[int], List[int]] = defaultdict(list)
+        for index, flight in enumerate(flights):
+            by_runway[flight.runway_id].append(index)
+        
+        # (i, j) input positions of each conflicting pair, i < j
+        conflict_pairs: List[Tuple[int, int]] = []
         
-        for i in range(n):
-            for j in range(i + 1, n):
-                if flights[i].overlaps_with(flights[j]):
-                    if flights[i].runway_id == flights[j].runway_id:
-                        conflicts.append(
-                            f"Conflict: {flights[i].flight_id} and {flights[j].flight_id} "
-                            f"both assigned to Runway {flights[i].runway_id}"
-                        )
+        for indices in by_runway.values():
+            indices.sort(key=lambda i: flights[i].arrival_start)
+            starts = [flights[i].arrival_start for i in indices]
+            
+            for pos, i in enumerate(indices):
+                last = bisect_left(starts, flights[i].arrival_end, pos + 1)
+                for j in indices[pos + 1:last]:
+                    conflict_pairs.append((i, j) if i < j else (j, i))
+        
+        # Report pairs in input order, as a pairwise scan would
+        conflict_pairs.sort()
+        conflicts = [
+            f"Conflict: {flights[i].flight_id} and {flights[j].flight_id} "
+            f"both assigned to Runway {flights[i].runway_id}"
+            for i, j in conflict_pairs
+        ]
         
         return len(conflicts) == 0, conflicts
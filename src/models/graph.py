@@ -9,6 +9,7 @@ conflict graphs.
 from dataclasses import dataclass, field
 from typing import Dict, List, Set, Tuple, Optional, Any, Generic, TypeVar
 from collections import defaultdict
+from bisect import bisect_left
 import heapq
 
 from .airport import Airport
@@ -212,6 +213,14 @@ class RouteGraph(Graph[Airport]):
             distance: Explicit distance (if None, calculated from coordinates)
             include_weather: Whether to include weather factors in weight
         """
+        if distance is None:
+            # Great-circle distance is symmetric, so compute it once for both legs
+            source = self.get_node(source_id)
+            dest = self.get_node(dest_id)
+            if source is None or dest is None:
+                raise ValueError(f"Both airports must exist: {source_id}, {dest_id}")
+            distance = source.distance_to(dest)
+        
         self.add_route(source_id, dest_id, distance, include_weather)
         self.add_route(dest_id, source_id, distance, include_weather)
     
@@ -246,6 +255,7 @@ class ConflictGraph(Graph[Flight]):
         super().__init__(directed=False)
         self._adjacency_matrix: Optional[List[List[bool]]] = None
         self._flight_index: Dict[str, int] = {}
+        self._edges: List[Tuple[str, str, float]] = []
     
     def add_flight(self, flight: Flight) -> None:
         """
@@ -271,12 +281,37 @@ class ConflictGraph(Graph[Flight]):
         for flight in flights:
             self.add_flight(flight)
         
-        # Detect conflicts and add edges
-        n = len(flights)
-        for i in range(n):
-            for j in range(i + 1, n):
-                if flights[i].overlaps_with(flights[j]):
-                    self.add_edge(flights[i].flight_id, flights[j].flight_id)
+        # With flights sorted by arrival, a flight conflicts exactly with the
+        # later flights that arrive before it clears the runway, which form a
+        # contiguous run located by binary search on the start times.
+        ordered = sorted(flights, key=lambda f: f.arrival_start)
+        starts = [f.arrival_start for f in ordered]
+        
+        for i, flight in enumerate(ordered):
+            last = bisect_left(starts, flight.arrival_end, i + 1)
+            for j in range(i + 1, last):
+                self.add_edge(flight.flight_id, ordered[j].flight_id)
+    
+    def add_edge(self, source: str, destination: str, weight: float = 1.0) -> None:
+        """
+        Add a conflict edge between two flights.
+        
+        Args:
+            source: First flight ID
+            destination: Second flight ID
+            weight: Edge weight (default 1.0)
+        """
+        super().add_edge(source, destination, weight)
+        self._edges.append((source, destination, weight))
+    
+    def get_all_edges(self) -> List[Tuple[str, str, float]]:
+        """
+        Get all conflict edges, each listed once.
+        
+        Returns:
+            List of (flight_id, flight_id, weight) tuples
+        """
+        return list(self._edges)
     
     def get_conflict_count(self, flight_id: str) -> int:
         """
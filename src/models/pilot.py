@@ -146,6 +146,11 @@ class PilotAssignment:
     flight_start: datetime
     flight_end: datetime
     
+    @property
+    def duration_hours(self) -> float:
+        """Get the flight duration in hours."""
+        return (self.flight_end - self.flight_start).total_seconds() / 3600
+    
     def __str__(self) -> str:
         return (
             f"Assignment: Pilot {self.pilot_id} -> Flight {self.flight_id} | "
@@ -171,10 +171,9 @@ class TimeUtils:
         """
         if include_date:
             fmt = "%Y-%m-%d %H:%M"
-        else:
-            fmt = "%H:%M"
+            return f"{start.strftime(fmt)} - {end.strftime(fmt)}"
         
-        return f"{start.strftime(fmt)} - {end.strftime(fmt)}"
+        return f"{TimeUtils.format_clock_time(start)} - {TimeUtils.format_clock_time(end)}"
     
     @staticmethod
     def generate_random_times(base_time: datetime, count: int,
@@ -224,6 +223,53 @@ class TimeUtils:
         
         return dt.replace(hour=new_hour % 24, minute=new_minute, second=0, microsecond=0)
     
+    @staticmethod
+    def parse_clock_time(text: str, day: Optional[datetime] = None) -> datetime:
+        """
+        Parse an 'HH:MM' clock time onto a given day.
+        
+        Splits the string directly rather than going through strptime,
+        which is far slower for such a fixed shape.
+        
+        Args:
+            text: Time of day as 'HH:MM'
+            day: Day to place the time on (defaults to today)
+            
+        Returns:
+            Datetime at that time of day, with seconds cleared
+            
+        Raises:
+            ValueError: If text is not a valid HH:MM time
+        """
+        hours, sep, minutes = text.partition(':')
+        # Both parts must be one or two ASCII digits; int() alone would
+        # also accept signs, underscores and surrounding whitespace
+        digits = hours + minutes
+        if not (sep and 0 < len(hours) <= 2 and 0 < len(minutes) <= 2
+                and digits.isascii() and digits.isdigit()):
+            raise ValueError(f"Expected HH:MM, got {text!r}")
+        
+        if day is None:
+            day = datetime.now()
+        
+        return day.replace(hour=int(hours), minute=int(minutes), second=0, microsecond=0)
+    
+    @staticmethod
+    def format_clock_time(dt: datetime) -> str:
+        """
+        Format a datetime as an 'HH:MM' clock time.
+        
+        Builds the string from the hour and minute fields, avoiding the
+        strftime overhead in per-flight table rows.
+        
+        Args:
+            dt: Datetime to format
+            
+        Returns:
+            Time of day as 'HH:MM'
+        """
+        return f"{dt.hour:02d}:{dt.minute:02d}"
+    
     @staticmethod
     def get_time_slot(dt: datetime, slot_minutes: int = 30) -> int:
         """
@@ -225,6 +225,79 @@ class TestPilotScheduler(unittest.TestCase):
         self.assertLessEqual(len(result.assignments), 10)  # Approximately 8/0.75
         self.assertGreater(len(result.unassigned_flights), 0)
     
+    def test_pilot_without_hours_for_long_flight_takes_later_short_one(self):
+        """Test that a pilot skipped for one flight stays available for later ones."""
+        scheduler = PilotScheduler(min_rest_hours=0.0, max_daily_hours=1.0)
+        scheduler.create_pilots(1, base_airport="JFK")
+        
+        flights = [
+            Flight(
+                flight_id="FL001",
+                origin="JFK",
+                destination="LHR",
+                arrival_start=self.base_time,
+                occupancy_time=60  # 1.5 hours with buffer, over the limit
+            ),
+            Flight(
+                flight_id="FL002",
+                origin="CDG",
+                destination="LHR",
+                arrival_start=self.base_time + timedelta(hours=1),
+                occupancy_time=15
+            )
+        ]
+        
+        result = scheduler.schedule(flights, strategy='least_busy')
+        
+        self.assertEqual([a.flight_id for a in result.assignments], ["FL002"])
+        self.assertEqual([f.flight_id for f in result.unassigned_flights], ["FL001"])
+    
+    def test_rest_check_with_non_round_rest_hours(self):
+        """Test that a rest period just over the gap leaves the flight unassigned."""
+        scheduler = PilotScheduler(min_rest_hours=0.5000000001, max_daily_hours=8.0)
+        scheduler.create_pilots(1, base_airport="JFK")
+        
+        flights = [
+            Flight(
+                flight_id="FL001",
+                origin="JFK",
+                destination="LHR",
+                arrival_start=self.base_time,
+                occupancy_time=1  # ends 31 minutes later
+            ),
+            Flight(
+                flight_id="FL002",
+                origin="CDG",
+                destination="LHR",
+                arrival_start=self.base_time + timedelta(minutes=61),  # exactly 0.5h rest
+                occupancy_time=1
+            )
+        ]
+        
+        result = scheduler.schedule(flights, strategy='least_busy')
+        
+        self.assertEqual([a.flight_id for a in result.assignments], ["FL001"])
+        self.assertEqual([f.flight_id for f in result.unassigned_flights], ["FL002"])
+    
+    def test_most_available_strategy(self):
+        """Test most available strategy picks the pilot with most hours left."""
+        self.scheduler.add_pilot(Pilot(pilot_id="P001", name="Capt. Short", max_daily_hours=2.0))
+        self.scheduler.add_pilot(Pilot(pilot_id="P002", name="Capt. Long", max_daily_hours=8.0))
+        
+        flights = [
+            Flight(
+                flight_id="FL001",
+                origin="JFK",
+                destination="LHR",
+                arrival_start=self.base_time,
+                occupancy_time=15
+            )
+        ]
+        
+        result = self.scheduler.schedule(flights, strategy='most_available')
+        
+        self.assertEqual(result.assignments[0].pilot_id, "P002")
+    
     def test_least_busy_strategy(self):
         """Test least busy strategy distributes work fairly."""
         # Create 3 pilots
@@ -260,6 +260,40 @@ class TestRoutePlanner(unittest.TestCase):
             self.assertEqual(path[0].id, 'A')
             self.assertEqual(path[-1].id, 'D')
     
+    def test_find_all_paths_respects_max_stops(self):
+        """Test that paths with too many stops are not returned."""
+        self.graph.add_route('A', 'D', distance=300)
+        
+        direct_only = self.planner.find_all_paths('A', 'D', max_stops=0)
+        self.assertEqual([[a.id for a in p] for p in direct_only], [['A', 'D']])
+        
+        one_stop = self.planner.find_all_paths('A', 'D', max_stops=1)
+        self.assertEqual(sorted(tuple(a.id for a in p) for p in one_stop),
+                         [('A', 'B', 'D'), ('A', 'C', 'D'), ('A', 'D')])
+    
+    def test_iter_paths_matches_find_all_paths(self):
+        """Test that the lazy path iterator yields the same paths as IDs."""
+        self.graph.add_route('A', 'D', distance=300)
+        
+        paths = self.planner.find_all_paths('A', 'D', max_stops=2)
+        path_ids = list(self.planner.iter_paths('A', 'D', max_stops=2))
+        
+        self.assertEqual(path_ids, [tuple(a.id for a in p) for p in paths])
+        self.assertEqual(list(self.planner.iter_paths('A', 'XXX')), [])
+    
+    def test_get_reachable_airports(self):
+        """Test reachable airports are listed by shortest distance."""
+        self.graph.add_airport(Airport(id='Z', name='Isolated', latitude=10.0, longitude=10.0))
+        
+        reachable = self.planner.get_reachable_airports('A')
+        self.assertEqual([(a.id, d) for a, d in reachable], [('B', 100), ('C', 150), ('D', 200)])
+        
+        nearby = self.planner.get_reachable_airports('A', max_distance=150)
+        self.assertEqual([a.id for a, _ in nearby], ['B', 'C'])
+        
+        with self.assertRaises(ValueError):
+            self.planner.get_reachable_airports('XXX')
+    
     def test_cruising_speed_setter(self):
         """Test setting cruising speed."""
         self.planner.set_cruising_speed(500)
@@ -286,6 +286,29 @@ class TestConflictGraph(unittest.TestCase):
         # But FL001 also overlaps with FL002 and FL003 (30 min window covers all)
         # All three flights overlap with each other, so all have degree 2
         self.assertEqual(max_degree, 2)
+    
+    def test_conflicts_match_pairwise_overlap(self):
+        """Test that every overlapping pair (and only those) becomes an edge."""
+        flights = [
+            Flight(flight_id=f"FL{i:03d}", origin="A", destination="X",
+                  arrival_start=self.base_time + timedelta(minutes=(i * 7) % 45),
+                  occupancy_time=10 + (i % 4) * 5)
+            for i in range(20)
+        ]
+        
+        graph = ConflictGraph()
+        graph.build_from_flights(flights)
+        
+        expected = {
+            frozenset((a.flight_id, b.flight_id))
+            for i, a in enumerate(flights)
+            for b in flights[i + 1:]
+            if a.overlaps_with(b)
+        }
+        edges = [frozenset((source, dest)) for source, dest, _ in graph.get_all_edges()]
+        
+        self.assertEqual(len(edges), len(expected))
+        self.assertEqual(set(edges), expected)
 
 
 class TestRunwayScheduler(unittest.TestCase):
@@ -348,6 +371,23 @@ class TestRunwayScheduler(unittest.TestCase):
         # FL001 and FL003 don't conflict, so they can share a runway
         self.assertEqual(result.num_runways, 2)
     
+    def test_conflict_edges_reported(self):
+        """Test that the result carries the conflicting flight pairs."""
+        flights = [
+            Flight(flight_id="FL001", origin="JFK", destination="LHR",
+                  arrival_start=self.base_time, occupancy_time=20),
+            Flight(flight_id="FL002", origin="CDG", destination="LHR",
+                  arrival_start=self.base_time + timedelta(minutes=10), occupancy_time=20),
+            Flight(flight_id="FL003", origin="FRA", destination="LHR",
+                  arrival_start=self.base_time + timedelta(minutes=25), occupancy_time=20),
+        ]
+        
+        result = RunwayScheduler().schedule(flights)
+        
+        pairs = {frozenset(edge) for edge in result.conflict_edges}
+        self.assertEqual(pairs, {frozenset({"FL001", "FL002"}), frozenset({"FL002", "FL003"})})
+        self.assertEqual(result.conflicts_resolved, 2)
+    
     def test_dsatur_algorithm(self):
         """Test DSatur algorithm produces valid schedule."""
         flights = [
@@ -398,11 +438,92 @@ class TestRunwayScheduler(unittest.TestCase):
         is_valid, conflicts = scheduler.validate_schedule(result.flights)
         self.assertTrue(is_valid)
     
+    def test_greedy_reuses_cleared_runways(self):
+        """Test that greedy uses only as many runways as peak overlap."""
+        offsets = [0, 5, 10, 20, 22, 40, 41, 42, 60]
+        flights = [
+            Flight(flight_id=f"FL{i:03}", origin="JFK", destination="LHR",
+                  arrival_start=self.base_time + timedelta(minutes=m), occupancy_time=15)
+            for i, m in enumerate(offsets)
+        ]
+        
+        scheduler = RunwayScheduler(algorithm='greedy')
+        result = scheduler.schedule(flights)
+        
+        # At most three windows are open at once (e.g. 40, 41, 42)
+        self.assertEqual(result.num_runways, 3)
+        self.assertTrue(scheduler.validate_schedule(result.flights)[0])
+    
     def test_invalid_algorithm(self):
         """Test that invalid algorithm raises error."""
         with self.assertRaises(ValueError):
             RunwayScheduler(algorithm='invalid')
     
+    def test_conflict_graph_reused_across_algorithms(self):
+        """Test that switching algorithms reuses the conflict graph."""
+        flights = [
+            Flight(flight_id="FL001", origin="JFK", destination="LHR",
+                  arrival_start=self.base_time, occupancy_time=15),
+            Flight(flight_id="FL002", origin="CDG", destination="LHR",
+                  arrival_start=self.base_time + timedelta(minutes=5), occupancy_time=15),
+        ]
+        
+        scheduler = RunwayScheduler(algorithm='dsatur')
+        graph = scheduler.build_conflict_graph(flights)
+        
+        scheduler.set_algorithm('welsh_powell')
+        self.assertEqual(scheduler.algorithm, 'welsh_powell')
+        self.assertIs(scheduler.build_conflict_graph(flights), graph)
+        
+        # A changed time window invalidates the cached graph
+        moved = Flight(flight_id="FL002", origin="CDG", destination="LHR",
+                       arrival_start=self.base_time + timedelta(minutes=30), occupancy_time=15)
+        self.assertIsNot(scheduler.build_conflict_graph([flights[0], moved]), graph)
+        
+        with self.assertRaises(ValueError):
+            scheduler.set_algorithm('invalid')
+    
+    def test_coloring_recomputed_when_flights_change(self):
+        """Test that a cached coloring is not applied to different flights."""
+        flights = [
+            Flight(flight_id="FL001", origin="JFK", destination="LHR",
+                  arrival_start=self.base_time, occupancy_time=15),
+            Flight(flight_id="FL002", origin="CDG", destination="LHR",
+                  arrival_start=self.base_time + timedelta(minutes=5), occupancy_time=15),
+        ]
+        
+        scheduler = RunwayScheduler(algorithm='dsatur')
+        self.assertEqual(scheduler.schedule(flights).num_runways, 2)
+        self.assertEqual(scheduler.schedule(flights).num_runways, 2)
+        
+        moved = Flight(flight_id="FL002", origin="CDG", destination="LHR",
+                       arrival_start=self.base_time + timedelta(minutes=30), occupancy_time=15)
+        result = scheduler.schedule([flights[0], moved])
+        
+        self.assertEqual(result.num_runways, 1)
+        self.assertEqual(moved.runway_id, 1)
+    
+    def test_reschedule_equal_flights_assigns_new_objects(self):
+        """Test that cached preparation is applied to the flights passed in."""
+        def make_flights():
+            return [
+                Flight(flight_id=f"FL00{i}", origin="JFK", destination="LHR",
+                      arrival_start=self.base_time + timedelta(minutes=offset), occupancy_time=15)
+                for i, offset in enumerate([20, 0, 5], 1)
+            ]
+        
+        scheduler = RunwayScheduler(algorithm='dsatur')
+        first = scheduler.schedule(make_flights())
+        
+        scheduler.set_algorithm('greedy')
+        flights = make_flights()
+        second = scheduler.schedule(flights)
+        
+        self.assertEqual(second.conflict_edges, first.conflict_edges)
+        self.assertTrue(all(f.runway_id is not None for f in flights))
+        self.assertEqual([f.flight_id for f in second.runway_assignments[1]], ["FL002", "FL001"])
+        self.assertIs(second.runway_assignments[1][1], flights[0])
+    
     def test_empty_flight_list(self):
         """Test scheduling empty flight list."""
         scheduler = RunwayScheduler()
@@ -443,6 +564,21 @@ class TestRunwayScheduler(unittest.TestCase):
         total_assigned = sum(len(flights) for flights in result.runway_assignments.values())
         self.assertEqual(total_assigned, 2)
     
+    def test_runway_assignments_in_arrival_order(self):
+        """Test that each runway's flights are listed by arrival time."""
+        flights = [
+            Flight(flight_id=f"FL{i:03}", origin="JFK", destination="LHR",
+                  arrival_start=self.base_time + timedelta(minutes=m),
+                  occupancy_time=10)
+            for i, m in enumerate([40, 0, 25, 5, 60, 12])
+        ]
+        
+        for algorithm in ('greedy', 'dsatur', 'welsh_powell'):
+            result = RunwayScheduler(algorithm=algorithm).schedule(list(flights))
+            for runway_flights in result.runway_assignments.values():
+                starts = [f.arrival_start for f in runway_flights]
+                self.assertEqual(starts, sorted(starts))
+    
     def test_validate_valid_schedule(self):
         """Test validation of a valid schedule."""
         flights = [
@@ -481,6 +617,27 @@ class TestRunwayScheduler(unittest.TestCase):
         self.assertFalse(is_valid)
         self.assertEqual(len(conflicts), 1)
     
+    def test_validate_reports_conflicts_per_runway(self):
+        """Test that only overlapping flights sharing a runway are reported."""
+        flights = [
+            Flight(flight_id=f"FL00{i}", origin="JFK", destination="LHR",
+                  arrival_start=self.base_time + timedelta(minutes=offset), occupancy_time=15)
+            for i, offset in enumerate([20, 0, 5, 10], 1)
+        ]
+        
+        # FL002/FL003 overlap on runway 1; FL001/FL004 overlap on runway 2
+        for flight, runway_id in zip(flights, [2, 1, 1, 2]):
+            flight.runway_id = runway_id
+        
+        scheduler = RunwayScheduler()
+        is_valid, conflicts = scheduler.validate_schedule(flights)
+        
+        self.assertFalse(is_valid)
+        self.assertEqual(conflicts, [
+            "Conflict: FL001 and FL004 both assigned to Runway 2",
+            "Conflict: FL002 and FL003 both assigned to Runway 1",
+        ])
+    
     def test_chromatic_number_bounds(self):
         """Test chromatic number bound estimation."""
         # Create a cycle of 3 flights (all pairs conflict)
@@ -498,6 +655,24 @@ class TestRunwayScheduler(unittest.TestCase):
         
         self.assertGreaterEqual(lower, 1)
         self.assertGreaterEqual(upper, lower)
+    
+    def test_chromatic_lower_bound_is_peak_overlap(self):
+        """Test that a long flight overlapping short ones needs only two runways."""
+        flights = [
+            Flight(flight_id="FL001", origin="JFK", destination="LHR",
+                  arrival_start=self.base_time, occupancy_time=60),
+        ] + [
+            Flight(flight_id=f"FL00{i}", origin="CDG", destination="LHR",
+                  arrival_start=self.base_time + timedelta(minutes=offset), occupancy_time=10)
+            for i, offset in enumerate([0, 20, 40], 2)
+        ]
+        
+        scheduler = RunwayScheduler()
+        lower, upper = scheduler.get_chromatic_number_bound(flights)
+        
+        self.assertEqual(lower, 2)
+        self.assertEqual(upper, 4)
+        self.assertEqual(scheduler.schedule(flights).num_runways, lower)
 
 
 class TestScheduleResult(unittest.TestCase):
@@ -542,6 +717,23 @@ class TestScheduleResult(unittest.TestCase):
         self.assertIn("FL001", table)
         self.assertIn("JFK", table)
         self.assertIn("LHR", table)
+    
+    def test_flights_by_arrival_includes_unassigned_flights(self):
+        """Test that flights missing from the runway lists are still listed."""
+        base_time = datetime(2025, 1, 1, 14, 0, 0)
+        
+        early = Flight(flight_id="FL001", origin="JFK", destination="LHR",
+                       arrival_start=base_time, occupancy_time=15)
+        late = Flight(flight_id="FL002", origin="CDG", destination="LHR",
+                      arrival_start=base_time + timedelta(minutes=30), occupancy_time=15)
+        
+        merged = ScheduleResult(flights=[late, early], num_runways=1,
+                                runway_assignments={1: [early, late]})
+        partial = ScheduleResult(flights=[late, early], num_runways=1,
+                                 runway_assignments={1: [late]})
+        
+        self.assertEqual([f.flight_id for f in merged.iter_flights_by_arrival()], ["FL001", "FL002"])
+        self.assertEqual([f.flight_id for f in partial.iter_flights_by_arrival()], ["FL001", "FL002"])
 
 
 if __name__ == '__main__':
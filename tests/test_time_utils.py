@@ -0,0 +1,46 @@
+"""
+Unit tests for the time utilities module.
+
+Tests parsing and formatting of clock times.
+"""
+
+import unittest
+import sys
+import os
+from datetime import datetime
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.time_utils import TimeUtils
+
+
+class TestClockTime(unittest.TestCase):
+    """Test cases for HH:MM clock time parsing and formatting."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.day = datetime(2025, 1, 15, 8, 45, 30)
+    
+    def test_parse_clock_time(self):
+        """Test parsing a clock time onto a given day."""
+        self.assertEqual(TimeUtils.parse_clock_time("14:05", self.day),
+                         datetime(2025, 1, 15, 14, 5))
+        self.assertEqual(TimeUtils.parse_clock_time("9:30", self.day),
+                         datetime(2025, 1, 15, 9, 30))
+    
+    def test_parse_clock_time_rejects_malformed_input(self):
+        """Test that only HH:MM made of plain digits is accepted."""
+        for text in ("1_0:3 0", " 10:30", "10:30 ", "+1:30", "10:-3",
+                     "1030", "10:", ":30", "123:00", "25:00", "10:60"):
+            with self.subTest(text=text):
+                with self.assertRaises(ValueError):
+                    TimeUtils.parse_clock_time(text, self.day)
+    
+    def test_format_clock_time(self):
+        """Test formatting a datetime as HH:MM."""
+        self.assertEqual(TimeUtils.format_clock_time(datetime(2025, 1, 15, 7, 3)), "07:03")
+
+
+if __name__ == '__main__':
+    unittest.main()